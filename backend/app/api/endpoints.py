@@ -1,32 +1,72 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import text
-from typing import List
-from datetime import datetime
-
-from app.db.session import get_db
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, raiseload, selectinload
+from sqlalchemy import Integer, bindparam, select, text
+from typing import List, Optional
+from datetime import datetime, timezone
+
+from app.core.cache import response_cache
+from app.db.session import get_db, get_sync_db, SessionLocal
 from app.db.models import Satellite, TLE, PassSchedule
 
+from app.services.job_queue import submit_job, get_job
 from app.services.tle_ingest import import_gp_group
 from app.services.pass_generator import generate_sample_pass_schedules, generate_realistic_pass_data
 from app.services.schedule_validator import validate_schedule_creation, get_schedule_statistics, optimize_schedule
-from app.api.schemas import SatelliteOut, TLEOut, PassScheduleOut
+from app.api.schemas import SatelliteOut, TLEOut, PassScheduleOut, PassSchedulePage
 
 router = APIRouter()
 
+# Statements for the hot by-NORAD-ID endpoints, built once at import time so
+# SQLAlchemy compiles each of them a single time instead of per request.
+_SATELLITE_EXISTS_STMT = select(Satellite.norad_id).where(
+    Satellite.norad_id == bindparam("norad_id")
+)
+_SATELLITE_BY_ID_STMT = (
+    select(Satellite)
+    .options(
+        selectinload(Satellite.tles),
+        selectinload(Satellite.pass_schedules),
+    )
+    .where(Satellite.norad_id == bindparam("norad_id"))
+)
+_TLES_FOR_SATELLITE_STMT = (
+    select(TLE)
+    .where(TLE.satellite_norad_id == bindparam("norad_id"))
+    .order_by(TLE.timestamp.desc())
+)
+_LATEST_TLE_STMT = _TLES_FOR_SATELLITE_STMT.limit(1)
+
+# Primary-key-style probe against the latest_tle materialized view, which
+# the ingest service refreshes after every import
+_LATEST_TLE_VIEW_SQL = text(
+    "SELECT tle_id, line1, line2, timestamp FROM latest_tle"
+    " WHERE satellite_norad_id = :norad_id"
+)
+
+
+async def _ensure_satellite_exists(db: AsyncSession, norad_id: int) -> None:
+    """Raise 404 if no satellite with the given NORAD ID exists."""
+    exists = await db.scalar(_SATELLITE_EXISTS_STMT, {"norad_id": norad_id})
+    if not exists:
+        raise HTTPException(status_code=404, detail="Satellite not found")
+
+
 @router.get("/")
-def root():
+async def root():
     return {"message": "Hello World"}
 
 @router.get("/health/db")
-def check_database_connection(db: Session = Depends(get_db)):
+async def check_database_connection(db: AsyncSession = Depends(get_db)):
     """
     Health check endpoint to verify database connection.
     Returns success if database is accessible, error otherwise.
     """
     try:
         # Execute a simple query to test the connection
-        result = db.execute(text("SELECT 1"))
+        result = await db.execute(text("SELECT 1"))
         result.fetchone()
         return {
             "status": "success",
@@ -40,189 +80,320 @@ def check_database_connection(db: Session = Depends(get_db)):
         )
 
 
-@router.post("/tle/refresh")
-def refresh_tle_data(group: str = "active", db: Session = Depends(get_db)):
+# Background job bodies for the long-running POST endpoints. Each opens its
+# own session since the request-scoped one is gone by the time the job runs.
+
+def _refresh_tle_job(group: str):
+    db = SessionLocal()
+    try:
+        summary = import_gp_group(db, group=group)
+    finally:
+        db.close()
+    # satellite/TLE listings are now stale
+    response_cache.invalidate_prefix("satellites:")
+    return summary
+
+
+def _generate_passes_job(method: str, days_ahead: int):
+    db = SessionLocal()
+    try:
+        if method == "realistic":
+            summary = generate_realistic_pass_data(db)
+        else:
+            summary = generate_sample_pass_schedules(db, days_ahead=days_ahead)
+    finally:
+        db.close()
+    # regenerated passes invalidate both listings (satellites embed them)
+    response_cache.invalidate_prefix("pass-schedules:")
+    response_cache.invalidate_prefix("satellites:")
+    return summary
+
+
+def _optimize_schedule_job():
+    db = SessionLocal()
+    try:
+        result = optimize_schedule(db)
+    finally:
+        db.close()
+    response_cache.invalidate_prefix("pass-schedules:")
+    response_cache.invalidate_prefix("satellites:")
+    return result
+
+
+@router.post("/tle/refresh", status_code=202)
+async def refresh_tle_data(group: str = "active"):
     """
     Import live TLE data from Celestrak into the local database.
 
     - Uses the Celestrak GP TLE text API
     - Upserts satellites by NORAD ID
     - Inserts TLE rows for each object
+
+    The import runs in the background; poll GET /jobs/{job_id} for the result.
     """
-    try:
-        summary = import_gp_group(db, group=group)
-        return {
-            "status": "success",
-            "message": "TLE data imported successfully",
-            "summary": summary,
-        }
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error importing TLE data: {str(e)}"
-        ) from e
+    job_id = await run_in_threadpool(submit_job, "tle_refresh", _refresh_tle_job, group)
+    return {
+        "status": "accepted",
+        "message": "TLE import started",
+        "job_id": job_id,
+        "poll": f"/jobs/{job_id}",
+    }
+
+
+# Batch size for the streamed /satellites listing
+SATELLITE_STREAM_BATCH_SIZE = 200
+
+# Assemble the nested satellite payload (satellite + tles + pass_schedules)
+# directly in Postgres. The server returns ready-to-ship JSON text per
+# satellite, skipping ORM hydration and per-row Python serialization
+# entirely. Shape mirrors SatelliteOut.
+_SATELLITE_JSON_SQL = text(
+    """
+    SELECT s.norad_id,
+           jsonb_build_object(
+               'norad_id', s.norad_id,
+               'name', s.name,
+               'description', s.description,
+               'tles', COALESCE((
+                   SELECT jsonb_agg(jsonb_build_object(
+                       'tle_id', t.tle_id,
+                       'line1', t.line1,
+                       'line2', t.line2,
+                       'timestamp', to_char(t.timestamp AT TIME ZONE 'UTC',
+                                            'YYYY-MM-DD"T"HH24:MI:SS"Z"')
+                   ) ORDER BY t.timestamp DESC)
+                   FROM tle t
+                   WHERE t.satellite_norad_id = s.norad_id), '[]'::jsonb),
+               'pass_schedules', COALESCE((
+                   SELECT jsonb_agg(jsonb_build_object(
+                       'pass_id', p.pass_id,
+                       'satellite_norad_id', p.satellite_norad_id,
+                       'satellite_name', s.name,
+                       'ground_station', p.ground_station,
+                       'start_time', to_char(p.start_time AT TIME ZONE 'UTC',
+                                             'YYYY-MM-DD"T"HH24:MI:SS"Z"'),
+                       'end_time', to_char(p.end_time AT TIME ZONE 'UTC',
+                                           'YYYY-MM-DD"T"HH24:MI:SS"Z"'),
+                       'status', p.status
+                   ) ORDER BY p.start_time)
+                   FROM passschedule p
+                   WHERE p.satellite_norad_id = s.norad_id), '[]'::jsonb)
+           )::text AS payload
+    FROM satellite s
+    WHERE :cursor IS NULL OR s.norad_id > :cursor
+    ORDER BY s.norad_id
+    LIMIT :batch
+    """
+    # explicit types so asyncpg can prepare the statement when cursor is NULL
+).bindparams(bindparam("cursor", type_=Integer), bindparam("batch", type_=Integer))
 
 
 @router.get("/satellites", response_model=List[SatelliteOut])
-def get_all_satellites_with_related_data(db: Session = Depends(get_db)):
-    """Get all satellites with their related TLE and PassSchedule data."""
-    try:
-        satellites = db.query(Satellite).options(
-            joinedload(Satellite.tles),
-            joinedload(Satellite.pass_schedules),
-        ).all()
+async def get_all_satellites_with_related_data(db: AsyncSession = Depends(get_db)):
+    """
+    Get all satellites with their related TLE and PassSchedule data.
 
-        return satellites
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error fetching satellites: {str(e)}",
-        )
+    The response is streamed: satellites are fetched in keyset batches and
+    serialized one at a time, so memory stays flat regardless of how many
+    satellites are in the database and the first bytes go out immediately.
+    The nested JSON itself is assembled by Postgres (jsonb_agg), so no ORM
+    objects are hydrated along the way.
+    """
+
+    async def satellite_json_stream():
+        yield b"["
+        first = True
+        cursor = None
+        while True:
+            rows = (
+                await db.execute(
+                    _SATELLITE_JSON_SQL,
+                    {"cursor": cursor, "batch": SATELLITE_STREAM_BATCH_SIZE},
+                )
+            ).all()
+            if not rows:
+                break
+
+            for norad_id, payload in rows:
+                if not first:
+                    yield b","
+                first = False
+                yield payload.encode()
+                cursor = norad_id
+
+            if len(rows) < SATELLITE_STREAM_BATCH_SIZE:
+                break
+        yield b"]"
+
+    return StreamingResponse(satellite_json_stream(), media_type="application/json")
 
 
 @router.get("/satellites/{norad_id}", response_model=SatelliteOut)
-def get_satellite_by_id(norad_id: int, db: Session = Depends(get_db)):
+async def get_satellite_by_id(norad_id: int, db: AsyncSession = Depends(get_db)):
     """Get a single satellite by NORAD ID, including its TLEs and pass schedules."""
-    satellite = (
-        db.query(Satellite)
-        .options(
-            joinedload(Satellite.tles),
-            joinedload(Satellite.pass_schedules),
-        )
-        .filter(Satellite.norad_id == norad_id)
-        .one_or_none()
-    )
+    cache_key = f"satellites:{norad_id}"
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    result = await db.execute(_SATELLITE_BY_ID_STMT, {"norad_id": norad_id})
+    satellite = result.scalars().one_or_none()
 
     if satellite is None:
         raise HTTPException(status_code=404, detail="Satellite not found")
 
+    response_cache.set(cache_key, satellite)
     return satellite
 
 
 @router.get("/satellites/{norad_id}/tles", response_model=List[TLEOut])
-def list_tles_for_satellite(norad_id: int, db: Session = Depends(get_db)):
+async def list_tles_for_satellite(norad_id: int, db: AsyncSession = Depends(get_db)):
     """List all TLEs for a given satellite (by NORAD ID), newest first."""
-    exists = (
-        db.query(Satellite.norad_id)
-        .filter(Satellite.norad_id == norad_id)
-        .scalar()
-    )
-    if not exists:
-        raise HTTPException(status_code=404, detail="Satellite not found")
+    result = await db.execute(_TLES_FOR_SATELLITE_STMT, {"norad_id": norad_id})
+    tles = result.scalars().all()
 
-    tles = (
-        db.query(TLE)
-        .filter(TLE.satellite_norad_id == norad_id)
-        .order_by(TLE.timestamp.desc())
-        .all()
-    )
+    # Only pay for the existence check when the TLE list is empty, to
+    # distinguish "unknown satellite" (404) from "no TLEs yet" ([])
+    if not tles:
+        await _ensure_satellite_exists(db, norad_id)
 
     return tles
 
 
 @router.get("/satellites/{norad_id}/tles/latest", response_model=TLEOut)
-def get_latest_tle_for_satellite(norad_id: int, db: Session = Depends(get_db)):
+async def get_latest_tle_for_satellite(norad_id: int, db: AsyncSession = Depends(get_db)):
     """Get the most recent TLE for a given satellite (by NORAD ID)."""
-    exists = (
-        db.query(Satellite.norad_id)
-        .filter(Satellite.norad_id == norad_id)
-        .scalar()
-    )
-    if not exists:
-        raise HTTPException(status_code=404, detail="Satellite not found")
+    try:
+        tle = (
+            await db.execute(_LATEST_TLE_VIEW_SQL, {"norad_id": norad_id})
+        ).mappings().first()
+    except Exception:  # noqa: BLE001
+        # view missing (e.g. never created); fall back to the base table
+        await db.rollback()
+        tle = None
 
-    tle = (
-        db.query(TLE)
-        .filter(TLE.satellite_norad_id == norad_id)
-        .order_by(TLE.timestamp.desc())
-        .first()
-    )
+    if tle is None:
+        result = await db.execute(_LATEST_TLE_STMT, {"norad_id": norad_id})
+        tle = result.scalars().first()
 
     if tle is None:
+        # one extra round-trip only on the miss path
+        await _ensure_satellite_exists(db, norad_id)
         raise HTTPException(status_code=404, detail="No TLEs found for this satellite")
 
     return tle
 
 
 
-@router.get("/pass-schedules", response_model=List[PassScheduleOut])
-def list_pass_schedules(db: Session = Depends(get_db)):
-    """List all scheduled passes with their associated satellite (by NORAD ID)."""
-    schedules = db.query(PassSchedule).options(joinedload(PassSchedule.satellite)).all()
+@router.get("/pass-schedules", response_model=PassSchedulePage)
+async def list_pass_schedules(
+    limit: int = 100,
+    cursor_start_time: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    List scheduled passes with their associated satellite (by NORAD ID).
+
+    Results are keyset-paginated on start_time (which is indexed): pass the
+    returned next_cursor back as cursor_start_time to fetch the next page.
+    """
+    limit = max(1, min(limit, 500))
+
+    cache_key = f"pass-schedules:{limit}:{cursor_start_time}"
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # project just the satellite name instead of hydrating a full Satellite
+    # ORM object per schedule row
+    stmt = (
+        select(PassSchedule, Satellite.name)
+        .join(Satellite, PassSchedule.satellite_norad_id == Satellite.norad_id)
+        .options(raiseload("*"))
+        .order_by(PassSchedule.start_time)
+        .limit(limit)
+    )
+    if cursor_start_time is not None:
+        stmt = stmt.where(PassSchedule.start_time > cursor_start_time)
+
+    rows = (await db.execute(stmt)).all()
 
     # inject satellite_name for response schema
-    for s in schedules:
-        s.satellite_name = s.satellite.name if s.satellite else None
+    schedules = []
+    for schedule, satellite_name in rows:
+        schedule.satellite_name = satellite_name
+        schedules.append(schedule)
 
-    return schedules
+    page = {
+        "items": schedules,
+        "next_cursor": schedules[-1].start_time if len(schedules) == limit else None,
+    }
 
+    response_cache.set(cache_key, page)
+    return page
 
 
-@router.post("/pass-schedules/generate")
-def generate_pass_schedules(
+
+@router.post("/pass-schedules/generate", status_code=202)
+async def generate_pass_schedules(
     method: str = "sample",
     days_ahead: int = 7,
-    db: Session = Depends(get_db)
 ):
     """
     Generate pass schedules for all satellites in the database.
-    
+
     - method: "sample" for test data, "realistic" for orbital calculations
     - days_ahead: number of days to generate passes for
+
+    Generation runs in the background; poll GET /jobs/{job_id} for the result.
     """
-    try:
-        if method == "realistic":
-            summary = generate_realistic_pass_data(db)
-        else:
-            summary = generate_sample_pass_schedules(db, days_ahead=days_ahead)
-        
-        return {
-            "status": "success",
-            "message": f"Generated pass schedules using {method} method",
-            "summary": summary,
-        }
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error generating pass schedules: {str(e)}"
-        ) from e
+    job_id = await run_in_threadpool(
+        submit_job, "pass_generation", _generate_passes_job, method, days_ahead
+    )
+    return {
+        "status": "accepted",
+        "message": f"Pass schedule generation started using {method} method",
+        "job_id": job_id,
+        "poll": f"/jobs/{job_id}",
+    }
 
 
 @router.post("/pass-schedules/validate")
-def validate_pass_schedule(
+async def validate_pass_schedule(
     satellite_norad_id: int,
     ground_station: str,
     start_time: datetime,
     end_time: datetime,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_sync_db)
 ):
     """
     Validate a proposed pass schedule for temporal conflicts.
-    
+
     - satellite_norad_id: NORAD catalog ID of the satellite
     - ground_station: Ground station name
     - start_time: Proposed start time (ISO format)
     - end_time: Proposed end time (ISO format)
-    
+
     Returns validation results with any detected conflicts.
     """
     try:
-        is_valid, conflicts = validate_schedule_creation(
+        is_valid, conflicts = await run_in_threadpool(
+            validate_schedule_creation,
             satellite_norad_id=satellite_norad_id,
             ground_station=ground_station,
             start_time=start_time,
             end_time=end_time,
             db=db
         )
-        
+
         return {
             "is_valid": is_valid,
             "conflicts": [conflict.to_dict() for conflict in conflicts],
             "total_conflicts": len(conflicts),
-            "high_severity_conflicts": len([c for c in conflicts if c.severity == "high"]),
-            "validation_timestamp": datetime.utcnow().isoformat() + "Z"
+            "high_severity_conflicts": sum(1 for c in conflicts if c.severity == "high"),
+            "validation_timestamp": datetime.now(timezone.utc).isoformat()
         }
-        
+
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -231,14 +402,14 @@ def validate_pass_schedule(
 
 
 @router.get("/schedule/statistics")
-def get_schedule_stats(db: Session = Depends(get_db)):
+async def get_schedule_stats(db: Session = Depends(get_sync_db)):
     """
     Get statistics about the current schedule state.
-    
+
     Returns summary information about scheduled passes, conflicts, and system health.
     """
     try:
-        stats = get_schedule_statistics(db)
+        stats = await run_in_threadpool(get_schedule_statistics, db)
         return stats
     except Exception as e:
         raise HTTPException(
@@ -247,21 +418,28 @@ def get_schedule_stats(db: Session = Depends(get_db)):
         ) from e
 
 
-@router.post("/schedule/optimize")
-def optimize_current_schedule(db: Session = Depends(get_db)):
+@router.post("/schedule/optimize", status_code=202)
+async def optimize_current_schedule():
     """
     Optimize the current schedule by resolving conflicts and finding better time slots.
-    
-    Returns summary of optimization results.
+
+    Optimization runs in the background; poll GET /jobs/{job_id} for the result.
     """
-    try:
-        result = optimize_schedule(db)
-        return {
-            "status": "success",
-            "optimization_result": result
-        }
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error optimizing schedule: {str(e)}"
-        ) from e
+    job_id = await run_in_threadpool(submit_job, "schedule_optimization", _optimize_schedule_job)
+    return {
+        "status": "accepted",
+        "message": "Schedule optimization started",
+        "job_id": job_id,
+        "poll": f"/jobs/{job_id}",
+    }
+
+
+@router.get("/jobs/{job_id}")
+async def get_job_status(job_id: str):
+    """Poll the status (and, once finished, the result) of a background job."""
+    # job records live in the database now; keep the blocking read off
+    # the event loop
+    job = await run_in_threadpool(get_job, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
@@ -1,20 +1,21 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class TLEOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     tle_id: int
     line1: str
     line2: str
     timestamp: Optional[datetime]
 
-    class Config:
-        orm_mode = True
-
 
 class PassScheduleOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     pass_id: int
     satellite_norad_id: int
     satellite_name: Optional[str] = None
@@ -23,16 +24,20 @@ class PassScheduleOut(BaseModel):
     end_time: Optional[datetime]
     status: str
 
-    class Config:
-        orm_mode = True
+
+class PassSchedulePage(BaseModel):
+    """One keyset-paginated page of pass schedules."""
+
+    items: List[PassScheduleOut]
+    # start_time to pass as cursor_start_time for the next page, if any
+    next_cursor: Optional[datetime] = None
 
 
 class SatelliteOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     norad_id: int
     name: str
     description: Optional[str] = None
     tles: List[TLEOut]
     pass_schedules: List[PassScheduleOut]
-
-    class Config:
-        orm_mode = True
@@ -0,0 +1,60 @@
+"""
+In-process TTL response cache for read-mostly endpoints.
+
+The satellite and pass-schedule listings only change when TLE data is
+refreshed or schedules are (re)generated, so repeat reads can be served
+from memory instead of re-running the SQL + ORM hydration path. Writes
+invalidate by key prefix (e.g. "satellites:") so stale entries never
+outlive the data they were built from.
+"""
+
+import threading
+import time
+from typing import Any, Optional
+
+# Default time-to-live for cached responses, in seconds
+DEFAULT_TTL_SECONDS = 30.0
+
+
+class TTLCache:
+    """Thread-safe key/value cache with per-entry expiry and prefix invalidation."""
+
+    def __init__(self, default_ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self._default_ttl = default_ttl_seconds
+        self._store = {}  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._store[key]
+                return None
+            return value
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store value under key for ttl_seconds (default TTL if not given)."""
+        ttl = self._default_ttl if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            self._store[key] = (time.monotonic() + ttl, value)
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        """Drop all entries whose key starts with prefix. Returns count removed."""
+        with self._lock:
+            stale = [k for k in self._store if k.startswith(prefix)]
+            for k in stale:
+                del self._store[k]
+            return len(stale)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._store.clear()
+
+
+# Shared cache instance for API response caching
+response_cache = TTLCache()
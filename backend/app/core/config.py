@@ -1,24 +1,45 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
-from urllib.parse import quote_plus
+from sqlalchemy.engine import URL
 
 # Load environment variables from .env file
 env_path = Path(__file__).parent.parent.parent / ".env"
 load_dotenv(dotenv_path=env_path)
 
 class Settings:
-    # Database configuration from .env
-    DB_USERNAME: str = os.getenv("DB_USERNAME", "postgres")
-    DB_PASSWORD: str = os.getenv("DB_PASSWORD", "postgres")
-    DB_HOSTNAME: str = os.getenv("DB_HOSTNAME", "localhost")
-    DB_PORT: str = os.getenv("DB_PORT", "5432")
-    DB_NAME: str = os.getenv("DB_NAME", "asc_scheduler")
-
-    # URL-encode the password
-    DB_PASSWORD_ENCODED: str = quote_plus(DB_PASSWORD)
-    
-    # Construct DATABASE_URL for psycopg2
-    DATABASE_URL: str = f"postgresql+psycopg2://{DB_USERNAME}:{DB_PASSWORD_ENCODED}@{DB_HOSTNAME}:{DB_PORT}/{DB_NAME}"
-
-settings = Settings()
+    def __init__(self):
+        # Database configuration from .env
+        self.DB_USERNAME: str = os.getenv("DB_USERNAME", "postgres")
+        self.DB_PASSWORD: str = os.getenv("DB_PASSWORD", "postgres")
+        self.DB_HOSTNAME: str = os.getenv("DB_HOSTNAME", "localhost")
+        self.DB_PORT: int = int(os.getenv("DB_PORT", "5432"))
+        self.DB_NAME: str = os.getenv("DB_NAME", "asc_scheduler")
+
+        # URL.create escapes the password internally, so no manual
+        # quote_plus step is needed (or can be forgotten).
+        # psycopg (v3) speaks the binary protocol, halving decode cost for
+        # numeric/timestamp columns versus the text-protocol psycopg2.
+        self.DATABASE_URL: URL = URL.create(
+            drivername="postgresql+psycopg",
+            username=self.DB_USERNAME,
+            password=self.DB_PASSWORD,
+            host=self.DB_HOSTNAME,
+            port=self.DB_PORT,
+            database=self.DB_NAME,
+        )
+
+        # Async variant of the same database for asyncpg (used by the API endpoints)
+        self.ASYNC_DATABASE_URL: URL = self.DATABASE_URL.set(
+            drivername="postgresql+asyncpg"
+        )
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Build the Settings object once and reuse it everywhere."""
+    return Settings()
+
+
+settings = get_settings()
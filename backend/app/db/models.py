@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from sqlalchemy import JSON, Column, Integer, String, DateTime, ForeignKey, Index, desc
 from sqlalchemy.orm import relationship
 from .session import Base
 
@@ -30,15 +30,54 @@ class TLE(Base):
     # Relationships
     satellite = relationship("Satellite", back_populates="tles")
 
-    # Index for fast TLE lookups by satellite and recency
+    # Covering index for fast TLE lookups by satellite and recency. The DESC
+    # ordering matches the "latest TLE" queries, and the INCLUDEd payload
+    # columns let Postgres answer them with an index-only scan (no heap fetch).
+    # The unique index backs ON CONFLICT DO NOTHING in the ingest path, so
+    # re-importing overlapping Celestrak groups doesn't duplicate TLEs.
     __table_args__ = (
-        Index('idx_tle_satellite_timestamp', 'satellite_norad_id', 'timestamp'),
+        Index(
+            'idx_tle_satellite_timestamp',
+            'satellite_norad_id',
+            desc('timestamp'),
+            postgresql_include=['line1', 'line2', 'tle_id'],
+        ),
+        Index(
+            'ix_tle_norad_epoch',
+            'satellite_norad_id',
+            'timestamp',
+            unique=True,
+        ),
     )
 
     def __repr__(self) -> str:
         return f"<TLE(tle_id={self.tle_id}, satellite_norad_id={self.satellite_norad_id})>"
 
 
+class BackgroundJob(Base):
+    """
+    Model for tracking background job status.
+
+    Job records live in the database rather than in process memory so the
+    202-accept/poll pattern works when uvicorn runs multiple workers: the
+    poll request may land on a different worker than the submit.
+    """
+
+    __tablename__ = "backgroundjob"
+
+    job_id = Column(String(32), primary_key=True)
+    name = Column(String(100), nullable=False)
+    status = Column(String(20), nullable=False, index=True)
+    submitted_at = Column(DateTime(timezone=True), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    result = Column(JSON, nullable=True)
+    error = Column(String, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<BackgroundJob(job_id={self.job_id}, name={self.name}, status={self.status})>"
+
+
 class PassSchedule(Base):
     """Model for storing passes that have been scheduled for execution."""
 
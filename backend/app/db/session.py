@@ -1,24 +1,57 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
-# Create the SQLAlchemy engine
-# pool_pre_ping=True helps handle dropped connections, improving reliability
+# Connection pool tuning shared by both engines. The SQLAlchemy defaults
+# (pool_size=5, max_overflow=10) throttle concurrent requests; LIFO checkout
+# keeps a small hot set of connections warm and lets idle ones be recycled.
+POOL_KWARGS = dict(
+    pool_pre_ping=True,
+    pool_size=20,
+    max_overflow=30,
+    pool_timeout=10,
+    pool_recycle=1800,
+    pool_use_lifo=True,
+)
+
+# Synchronous engine (psycopg2)
+# Used for table creation and by the background services, which run outside
+# the event loop. pool_pre_ping=True helps handle dropped connections.
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True
+    **POOL_KWARGS
+)
+
+# Async engine (asyncpg) used by the API endpoints so DB round-trips
+# suspend the coroutine instead of occupying a thread-pool slot
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL,
+    **POOL_KWARGS
 )
 
 # Create a SessionLocal class to get a database session
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async session factory for request-scoped sessions
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 # Base class for model definitions
 Base = declarative_base()
 
-# Dependency to get a database session (used by FastAPI endpoints)
-def get_db():
-    """Provides a database session for a single request (Dependency Injection)."""
+
+# Dependency to get an async database session (used by FastAPI endpoints)
+async def get_db():
+    """Provides an async database session for a single request (Dependency Injection)."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Dependency to get a synchronous session (used by endpoints that delegate
+# to the synchronous service layer via the threadpool)
+def get_sync_db():
+    """Provides a synchronous database session for a single request (Dependency Injection)."""
     db = SessionLocal()
     try:
         yield db
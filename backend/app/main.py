@@ -1,15 +1,65 @@
+import logging
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.endpoints import router
+from app.core.cache import response_cache
+from app.core.config import settings
 # Import models to ensure SQLAlchemy knows about them
 from app.db import models  # noqa: F401
 from app.db.session import engine
 
+logger = logging.getLogger(__name__)
+
 # Create database tables
 models.Base.metadata.create_all(bind=engine)
 
-app = FastAPI(title="ASC Scheduler API")
+# Ensure the unique (satellite_norad_id, timestamp) index backing the TLE
+# ingest path's ON CONFLICT DO NOTHING exists on pre-existing databases
+# (create_all only adds indexes together with new tables). Duplicate rows
+# from before the constraint are removed first, or the index build fails.
+try:
+    from sqlalchemy import text as _text
+    from app.services.tle_ingest import TLE_DEDUP_DML, TLE_NORAD_EPOCH_INDEX_DDL
+
+    with engine.begin() as conn:
+        conn.execute(_text(TLE_DEDUP_DML))
+        conn.execute(_text(TLE_NORAD_EPOCH_INDEX_DDL))
+except Exception as e:  # noqa: BLE001
+    logging.getLogger(__name__).warning("Could not create TLE dedup index: %s", e)
+
+# Upgrade the latest-TLE lookup index to the covering DESC + INCLUDE
+# definition on databases that predate it (same create_all limitation as
+# above). SQLite gets the plain index from create_all and skips this.
+try:
+    from sqlalchemy import text as _text
+    from app.services.tle_ingest import (
+        TLE_COVERING_INDEX_DDL,
+        TLE_COVERING_INDEX_UPGRADE_DDL,
+    )
+
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as conn:
+            conn.execute(_text(TLE_COVERING_INDEX_UPGRADE_DDL))
+            conn.execute(_text(TLE_COVERING_INDEX_DDL))
+except Exception as e:  # noqa: BLE001
+    logging.getLogger(__name__).warning("Could not upgrade TLE covering index: %s", e)
+
+# Create the latest-TLE materialized view (refreshed by the ingest service)
+try:
+    from sqlalchemy import text as _text
+    from app.services.tle_ingest import LATEST_TLE_VIEW_DDL, LATEST_TLE_VIEW_INDEX_DDL
+
+    with engine.begin() as conn:
+        conn.execute(_text(LATEST_TLE_VIEW_DDL))
+        conn.execute(_text(LATEST_TLE_VIEW_INDEX_DDL))
+except Exception as e:  # noqa: BLE001
+    logging.getLogger(__name__).warning("Could not create latest_tle view: %s", e)
+
+# orjson serializes datetimes and nested models in C, well ahead of stdlib json
+app = FastAPI(title="ASC Scheduler API", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -20,3 +70,39 @@ app.add_middleware(
 )
 
 app.include_router(router)
+
+
+@app.on_event("startup")
+async def start_cache_invalidation_listener():
+    """
+    Listen for Postgres NOTIFY on the tle_updated channel.
+
+    The TLE ingest service notifies after each committed import, so every
+    worker process drops its cached satellite listings immediately instead
+    of serving stale data until the TTL runs out.
+    """
+    import asyncpg
+
+    dsn = settings.ASYNC_DATABASE_URL.render_as_string(hide_password=False).replace(
+        "postgresql+asyncpg", "postgresql"
+    )
+
+    def _on_tle_updated(connection, pid, channel, payload):
+        logger.info("TLE update notification received (group=%s), invalidating cache", payload)
+        response_cache.invalidate_prefix("satellites:")
+        response_cache.invalidate_prefix("pass-schedules:")
+
+    try:
+        conn = await asyncpg.connect(dsn)
+        await conn.add_listener("tle_updated", _on_tle_updated)
+        app.state.tle_notify_conn = conn
+    except Exception as e:  # noqa: BLE001
+        # cache falls back to TTL-only expiry if the listener can't start
+        logger.warning("Could not start tle_updated listener: %s", e)
+
+
+@app.on_event("shutdown")
+async def stop_cache_invalidation_listener():
+    conn = getattr(app.state, "tle_notify_conn", None)
+    if conn is not None:
+        await conn.close()
@@ -0,0 +1,169 @@
+"""
+Background Job Runner
+
+This module lets long-running work (TLE imports, pass generation, schedule
+optimization) be accepted with 202 and executed off the request path, so
+API workers stay free for the short read endpoints. Jobs run on a small
+thread pool and their status/result can be polled by ID.
+
+Job records are persisted in the backgroundjob table rather than process
+memory: under multi-worker uvicorn the poll request routinely lands on a
+different worker than the submit, and an in-process dict would 404 there.
+"""
+
+import json
+import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+from app.db.models import BackgroundJob
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Job lifecycle states
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+# Keep at most this many finished job records around for polling
+MAX_FINISHED_JOBS = 100
+
+# Small pool: these jobs are heavy (network + DB), running many at once
+# would just contend for the same resources
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="asc-job")
+
+
+def _prune_finished(db) -> None:
+    """Drop the oldest finished jobs beyond MAX_FINISHED_JOBS."""
+    stale_ids = [
+        job_id for (job_id,) in (
+            db.query(BackgroundJob.job_id)
+            .filter(BackgroundJob.status.in_((JOB_COMPLETED, JOB_FAILED)))
+            .order_by(BackgroundJob.submitted_at.desc())
+            .offset(MAX_FINISHED_JOBS)
+            .all()
+        )
+    ]
+    if stale_ids:
+        db.query(BackgroundJob).filter(
+            BackgroundJob.job_id.in_(stale_ids)
+        ).delete(synchronize_session=False)
+
+
+def _storable_result(result: Any) -> Any:
+    """
+    Coerce a job result into something the JSON column can hold.
+
+    submit_job accepts arbitrary callables, so results may contain
+    datetimes or other non-JSON types; a round-trip with default=str
+    keeps the structure and stringifies just those values. Anything
+    still unserializable is stored as its repr.
+    """
+    try:
+        json.dumps(result)
+        return result
+    except Exception:  # noqa: BLE001
+        try:
+            return json.loads(json.dumps(result, default=str))
+        except Exception:  # noqa: BLE001 - str() on a value may itself raise
+            return repr(result)
+
+
+def _update_job(job_id: str, **fields: Any) -> bool:
+    """Write a status transition for job_id; never raises into the worker."""
+    try:
+        db = SessionLocal()
+        try:
+            db.query(BackgroundJob).filter(
+                BackgroundJob.job_id == job_id
+            ).update(fields)
+            db.commit()
+        finally:
+            db.close()
+        return True
+    except Exception as e:  # noqa: BLE001
+        logger.error("Failed to record status for job %s: %s", job_id, e)
+        return False
+
+
+def submit_job(name: str, func: Callable, *args: Any, **kwargs: Any) -> str:
+    """
+    Submit func(*args, **kwargs) for background execution.
+
+    Returns a job ID that can be passed to get_job() to poll for status
+    and, once completed, the function's return value.
+    """
+    job_id = uuid.uuid4().hex
+
+    db = SessionLocal()
+    try:
+        db.add(BackgroundJob(
+            job_id=job_id,
+            name=name,
+            status=JOB_QUEUED,
+            submitted_at=datetime.now(timezone.utc),
+        ))
+        _prune_finished(db)
+        db.commit()
+    finally:
+        db.close()
+
+    def _run():
+        _update_job(job_id, status=JOB_RUNNING, started_at=datetime.now(timezone.utc))
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:  # noqa: BLE001
+            logger.error("Background job '%s' (%s) failed: %s", name, job_id, e)
+            _update_job(
+                job_id,
+                status=JOB_FAILED,
+                error=str(e),
+                finished_at=datetime.now(timezone.utc),
+            )
+            return
+        recorded = _update_job(
+            job_id,
+            status=JOB_COMPLETED,
+            result=_storable_result(result),
+            finished_at=datetime.now(timezone.utc),
+        )
+        if not recorded:
+            # Never leave the job stuck in "running" for pollers: if the
+            # completion write fails, mark the job failed instead
+            _update_job(
+                job_id,
+                status=JOB_FAILED,
+                error="Job finished but its result could not be recorded",
+                finished_at=datetime.now(timezone.utc),
+            )
+            return
+        logger.info("Background job '%s' (%s) completed", name, job_id)
+
+    _executor.submit(_run)
+    logger.info("Submitted background job '%s' as %s", name, job_id)
+    return job_id
+
+
+def get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """Return the job record for job_id as a dict, or None if unknown."""
+    db = SessionLocal()
+    try:
+        job = db.get(BackgroundJob, job_id)
+        if job is None:
+            return None
+        return {
+            "job_id": job.job_id,
+            "name": job.name,
+            "status": job.status,
+            "submitted_at": job.submitted_at.isoformat() if job.submitted_at else None,
+            "started_at": job.started_at.isoformat() if job.started_at else None,
+            "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+            "result": job.result,
+            "error": job.error,
+        }
+    finally:
+        db.close()
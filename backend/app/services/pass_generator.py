@@ -5,8 +5,11 @@ This module provides functionality to generate realistic pass schedules for sate
 based on their TLE data and ground station locations using orbital mechanics.
 """
 
+import functools
 import logging
+import math
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional
 from pathlib import Path
@@ -20,7 +23,16 @@ except ImportError:
     PYORBITAL_AVAILABLE = False
     logging.warning("pyorbital not available. Install with: pip install pyorbital")
 
-from sqlalchemy.orm import Session
+# Import sgp4 + numpy for batched propagation across all satellites at once
+try:
+    import numpy as np
+    from sgp4.api import Satrec, SatrecArray, jday
+    SGP4_AVAILABLE = True
+except ImportError:
+    SGP4_AVAILABLE = False
+    logging.warning("sgp4/numpy not available. Install with: pip install sgp4 numpy")
+
+from sqlalchemy.orm import Session, selectinload
 from app.db.models import Satellite, TLE, PassSchedule
 
 # Load environment variables
@@ -29,16 +41,261 @@ load_dotenv(dotenv_path=env_path)
 
 logger = logging.getLogger(__name__)
 
-# Default ground station
+# Default ground station (coordinates parsed to float once at module load)
 DEFAULT_GROUND_STATION = {
     "name": os.getenv("DEFAULT_GROUND_STATION_NAME", "dummy"),
-    "lat": os.getenv("DEFAULT_GROUND_STATION_LAT", "71"),
-    "lon": os.getenv("DEFAULT_GROUND_STATION_LON", "116"),
-    "alt": os.getenv("DEFAULT_GROUND_STATION_ALT", "1.070")
+    "lat": float(os.getenv("DEFAULT_GROUND_STATION_LAT", "71")),
+    "lon": float(os.getenv("DEFAULT_GROUND_STATION_LON", "116")),
+    "alt": float(os.getenv("DEFAULT_GROUND_STATION_ALT", "1.070"))
 }
 
-MIN_PASS_ELEVATION_DEGREES = os.getenv("MIN_PASS_ELEVATION_DEGREES", "1.0")
-MAX_PASS_ELEVATION_DEGREES = os.getenv("MAX_PASS_ELEVATION_DEGREES", "5.0")
+MIN_PASS_ELEVATION_DEGREES = float(os.getenv("MIN_PASS_ELEVATION_DEGREES", "1.0"))
+MAX_PASS_ELEVATION_DEGREES = float(os.getenv("MAX_PASS_ELEVATION_DEGREES", "5.0"))
+
+# WGS-84 ellipsoid constants (km)
+_WGS84_A = 6378.137
+_WGS84_F = 1.0 / 298.257223563
+_WGS84_E2 = _WGS84_F * (2.0 - _WGS84_F)
+
+
+def _observer_ecef(lat_deg: float, lon_deg: float, alt_km: float):
+    """
+    Convert geodetic ground-station coordinates to an ECEF position vector
+    and the local geodetic "up" unit vector (both in km / unitless).
+    """
+    lat = np.radians(lat_deg)
+    lon = np.radians(lon_deg)
+    sin_lat, cos_lat = np.sin(lat), np.cos(lat)
+    sin_lon, cos_lon = np.sin(lon), np.cos(lon)
+
+    n = _WGS84_A / np.sqrt(1.0 - _WGS84_E2 * sin_lat * sin_lat)
+    position = np.array([
+        (n + alt_km) * cos_lat * cos_lon,
+        (n + alt_km) * cos_lat * sin_lon,
+        (n * (1.0 - _WGS84_E2) + alt_km) * sin_lat,
+    ])
+    up = np.array([cos_lat * cos_lon, cos_lat * sin_lon, sin_lat])
+    return position, up
+
+
+# The default ground station never moves, so its ECEF position and local
+# "up" vector are computed once at import instead of per batch
+if SGP4_AVAILABLE:
+    OBSERVER_ECEF, OBSERVER_UP = _observer_ecef(
+        DEFAULT_GROUND_STATION["lat"],
+        DEFAULT_GROUND_STATION["lon"],
+        DEFAULT_GROUND_STATION["alt"],
+    )
+
+
+def _gmst_radians(jd, fr):
+    """
+    Greenwich Mean Sidereal Time for the given julian date arrays, in radians.
+
+    Uses the linear IAU 1982 approximation, which is accurate to well under a
+    degree over the 48h prediction horizon - plenty for pass windows.
+    """
+    t = (jd - 2451545.0) + fr
+    return np.radians((280.46061837 + 360.98564736629 * t) % 360.0)
+
+
+def _build_time_grid(
+    start_time: datetime,
+    hours: int = 48,
+    step_seconds: int = 30,
+) -> Dict[str, Any]:
+    """
+    Precompute everything about the prediction window that is the same for
+    every satellite: the julian-date arrays for SGP4 and the GMST rotation
+    terms for the TEME->earth-fixed transform. Building this once per run
+    (instead of per satellite) removes O(n_sats x n_times) redundant trig.
+    """
+    n_times = int(hours * 3600 // step_seconds) + 1
+    offsets = np.arange(n_times, dtype=np.float64) * step_seconds
+    jd0, fr0 = jday(
+        start_time.year, start_time.month, start_time.day,
+        start_time.hour, start_time.minute, start_time.second,
+    )
+    jd = np.full(n_times, jd0)
+    fr = fr0 + offsets / 86400.0
+
+    theta = _gmst_radians(jd, fr)
+    return {
+        "start_time": start_time,
+        "offsets": offsets,
+        "jd": jd,
+        "fr": fr,
+        "cos_theta": np.cos(theta),
+        "sin_theta": np.sin(theta),
+    }
+
+
+def _calculate_passes_batch(
+    tle_records: List[tuple],
+    start_time: Optional[datetime] = None,
+    hours: int = 48,
+    step_seconds: int = 30,
+    count: int = 3,
+    grid: Optional[Dict[str, Any]] = None,
+) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Calculate passes for many satellites in one vectorized SGP4 run.
+
+    Instead of propagating each satellite separately through pyorbital,
+    all TLEs are loaded into a SatrecArray and propagated over a shared
+    48h time grid in a single call, producing an (n_sats, n_times, 3)
+    position array. Elevation above the default ground station is then
+    computed with NumPy for the whole grid at once, and pass windows are
+    read off as horizon crossings per satellite.
+
+    Args:
+        tle_records: list of (norad_id, line1, line2) tuples
+        start_time: UTC start of the prediction window (defaults to now)
+        hours: length of the prediction window
+        step_seconds: time-grid resolution (pass boundaries are rounded to it)
+        count: maximum number of passes to keep per satellite
+        grid: precomputed _build_time_grid result to share across calls
+
+    Returns:
+        Dict mapping norad_id to a list of pass dicts with start_time,
+        end_time, max_elevation, and duration_minutes.
+    """
+    if not SGP4_AVAILABLE:
+        logger.error("sgp4/numpy not available. Cannot calculate passes.")
+        return {}
+
+    if grid is None:
+        if start_time is None:
+            start_time = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+        grid = _build_time_grid(start_time, hours=hours, step_seconds=step_seconds)
+
+    start_time = grid["start_time"]
+    offsets = grid["offsets"]
+    jd, fr = grid["jd"], grid["fr"]
+
+    # Parse TLEs; skip (and log) any that sgp4 rejects
+    satrecs = []
+    norad_ids = []
+    for norad_id, line1, line2 in tle_records:
+        try:
+            satrecs.append(Satrec.twoline2rv(line1, line2))
+            norad_ids.append(norad_id)
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f"Failed to parse TLE for satellite {norad_id}: {e}")
+    if not satrecs:
+        return {}
+
+    # One batched propagation for every satellite on the shared grid (km, TEME)
+    errors, positions, _ = SatrecArray(satrecs).sgp4(jd, fr)
+
+    # Rotate TEME -> earth-fixed by the precomputed GMST terms (polar motion
+    # is negligible at pass-prediction accuracy)
+    cos_t, sin_t = grid["cos_theta"], grid["sin_theta"]
+    x = positions[..., 0] * cos_t + positions[..., 1] * sin_t
+    y = -positions[..., 0] * sin_t + positions[..., 1] * cos_t
+    z = positions[..., 2]
+
+    observer, up = OBSERVER_ECEF, OBSERVER_UP
+
+    # Elevation of every satellite at every grid time, in one shot
+    dx, dy, dz = x - observer[0], y - observer[1], z - observer[2]
+    slant_range = np.sqrt(dx * dx + dy * dy + dz * dz)
+    sin_elevation = (dx * up[0] + dy * up[1] + dz * up[2]) / slant_range
+    elevation = np.degrees(np.arcsin(np.clip(sin_elevation, -1.0, 1.0)))
+    # treat propagation errors as below the horizon
+    elevation[errors != 0] = -90.0
+
+    min_elevation = MIN_PASS_ELEVATION_DEGREES
+
+    results: Dict[int, List[Dict[str, Any]]] = {}
+    for i, norad_id in enumerate(norad_ids):
+        above = (elevation[i] > 0.0).astype(np.int8)
+        crossings = np.diff(above)
+        rises = np.where(crossings == 1)[0] + 1
+        sets = np.where(crossings == -1)[0] + 1
+        # ignore a pass already in progress at the window start
+        if len(sets) and (not len(rises) or sets[0] <= rises[0]):
+            sets = sets[1:]
+
+        passes = []
+        for rise, fall in zip(rises, sets):
+            max_elevation = float(elevation[i, rise:fall].max())
+            if max_elevation < min_elevation:
+                continue
+
+            pass_start = start_time + timedelta(seconds=float(offsets[rise]))
+            pass_end = start_time + timedelta(seconds=float(offsets[fall]))
+            duration_seconds = (pass_end - pass_start).total_seconds()
+            if duration_seconds <= 0:
+                continue
+
+            # keep native datetimes; callers that need JSON use _serialize_pass
+            passes.append({
+                "start_time": pass_start,
+                "end_time": pass_end,
+                "max_elevation": round(max_elevation, 2),
+                "duration_minutes": round(duration_seconds / 60, 1),
+            })
+            if len(passes) >= count:
+                break
+
+        results[norad_id] = passes
+
+    return results
+
+
+# Below this many satellites the process spawn/pickle overhead outweighs
+# the parallel speedup, so the batch runs in-process
+_PARALLEL_MIN_SATELLITES = 500
+
+
+def _calc_passes_chunk(args: tuple) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    ProcessPoolExecutor worker: propagate one chunk of TLE records.
+
+    Takes a single picklable (tle_chunk, start_time, count) tuple and
+    rebuilds the time grid locally - cheap next to the propagation itself.
+    """
+    tle_chunk, start_time, count = args
+    return _calculate_passes_batch(tle_chunk, start_time=start_time, count=count)
+
+
+def _calculate_passes_parallel(
+    tle_records: List[tuple],
+    start_time: datetime,
+    count: int = 3,
+) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Split the TLE list across CPU cores and propagate each chunk in its own
+    process, merging the per-chunk pass dicts. SGP4 propagation is
+    CPU-bound and independent per satellite, so large constellations scale
+    near-linearly with core count; small inputs fall back to one in-process
+    batch call.
+    """
+    workers = os.cpu_count() or 1
+    if len(tle_records) < _PARALLEL_MIN_SATELLITES or workers < 2:
+        grid = _build_time_grid(start_time)
+        return _calculate_passes_batch(tle_records, count=count, grid=grid)
+
+    chunk_size = math.ceil(len(tle_records) / workers)
+    chunks = [tle_records[i:i + chunk_size] for i in range(0, len(tle_records), chunk_size)]
+
+    results: Dict[int, List[Dict[str, Any]]] = {}
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        for chunk_result in executor.map(
+            _calc_passes_chunk, [(chunk, start_time, count) for chunk in chunks]
+        ):
+            results.update(chunk_result)
+    return results
+
+
+def _serialize_pass(pass_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a pass dict's native datetimes as ISO-8601 Z strings for JSON."""
+    serialized = dict(pass_data)
+    serialized["start_time"] = pass_data["start_time"].strftime("%Y-%m-%dT%H:%M:%S") + "Z"
+    serialized["end_time"] = pass_data["end_time"].strftime("%Y-%m-%dT%H:%M:%S") + "Z"
+    return serialized
+
 
 def get_latest_tle_for_satellite(db: Session, norad_id: str) -> Optional[Dict[str, str]]:
     """
@@ -61,39 +318,55 @@ def get_latest_tle_for_satellite(db: Session, norad_id: str) -> Optional[Dict[st
         return None
 
 
+@functools.lru_cache(maxsize=4096)
+def _get_orbital(norad_id: str, line1: str, line2: str) -> "Orbital":
+    """
+    Construct (or reuse) an Orbital object for a TLE.
+
+    Orbital() parses the TLE and initializes SGP4 state on every call, and
+    its result is deterministic given the TLE lines, so repeated runs for
+    the same satellite (retries, optimize cycles) can share one instance.
+    """
+    return Orbital(norad_id, line1=line1, line2=line2)
+
+
 def calculate_satellite_passes(
     norad_id: str,
     tle_data: Dict[str, str],
     lat: float = DEFAULT_GROUND_STATION["lat"],
     lon: float = DEFAULT_GROUND_STATION["lon"],
     alt: float = DEFAULT_GROUND_STATION["alt"],
-    count: int = 5
+    count: int = 5,
+    start_time: Optional[datetime] = None
 ) -> List[Dict[str, Any]]:
     """
     Calculate satellite passes using pyorbital.
-    
+
     Args:
         norad_id: NORAD catalog ID of the satellite
         tle_data: Dict with 'line1' and 'line2' TLE data
         lat: Ground station latitude in degrees
-        lon: Ground station longitude in degrees  
+        lon: Ground station longitude in degrees
         alt: Ground station altitude in km
         count: Number of passes to calculate
-        
+        start_time: UTC start of the prediction window; defaults to the
+            current minute. Callers processing many satellites in a loop
+            should compute this once and pass it in.
+
     Returns:
         List of pass dictionaries with start_time, end_time, max_elevation, duration_minutes
     """
     if not PYORBITAL_AVAILABLE:
         logger.error("pyorbital not available. Cannot calculate passes.")
         return []
-    
+
     try:
-        # Initialize Orbital object with TLE data
-        orb = Orbital(norad_id, line1=tle_data["line1"], line2=tle_data["line2"])
-        
-        # Get current UTC time
-        start_time = datetime.now(timezone.utc).replace(second=0, microsecond=0)
-        
+        # Initialize (or reuse a cached) Orbital object for this TLE
+        orb = _get_orbital(norad_id, tle_data["line1"], tle_data["line2"])
+
+        if start_time is None:
+            start_time = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+
         # Calculate passes for next 48 hours (should be enough for multiple passes)
         length_hours = 48
         
@@ -104,28 +377,43 @@ def calculate_satellite_passes(
             logger.warning(f"No passes calculated for satellite {norad_id}")
             return []
         
-        processed_passes = []
-        
-        for i, pass_data in enumerate(passes_data[:count]):
-            try:
-                start_time_pass, end_time_pass, max_elevation_time = pass_data
-                
-                # Calculate maximum elevation at the peak time
+        selected_passes = passes_data[:count]
+
+        # Calculate the peak elevation of every pass in one vectorized call.
+        # pyorbital broadcasts get_observer_look over datetime64 arrays, so
+        # this replaces one scalar trig/ECEF call per pass with a single
+        # NumPy call; fall back to the scalar loop if broadcasting fails.
+        try:
+            peak_times = np.array([p[2] for p in selected_passes], dtype="datetime64[us]")
+            _azimuths, elevations = orb.get_observer_look(peak_times, lon, lat, alt)
+            elevations = np.atleast_1d(np.asarray(elevations, dtype=float))
+        except Exception as e:
+            logger.warning(f"Vectorized elevation calculation failed for satellite {norad_id}, falling back to per-pass calls: {e}")
+            elevations = []
+            for i, pass_data in enumerate(selected_passes):
                 try:
-                    azimuth, elevation = orb.get_observer_look(max_elevation_time, lon, lat, alt)
-                    max_elevation = float(elevation)
+                    _azimuth, elevation = orb.get_observer_look(pass_data[2], lon, lat, alt)
+                    elevations.append(float(elevation))
                 except Exception as e:
                     logger.warning(f"Could not calculate elevation for pass {i+1} of satellite {norad_id}: {e}")
-                    max_elevation = MAX_PASS_ELEVATION_DEGREES
-                
+                    elevations.append(MAX_PASS_ELEVATION_DEGREES)
+
+        processed_passes = []
+
+        for i, (pass_data, max_elevation) in enumerate(zip(selected_passes, elevations)):
+            try:
+                start_time_pass, end_time_pass, _max_elevation_time = pass_data
+                max_elevation = float(max_elevation)
+
                 # Only include passes above minimum elevation
                 if max_elevation >= MIN_PASS_ELEVATION_DEGREES:
                     duration_seconds = (end_time_pass - start_time_pass).total_seconds()
                     
                     if duration_seconds > 0:
+                        # keep native datetimes (pyorbital returns naive UTC)
                         processed_passes.append({
-                            "start_time": start_time_pass.isoformat() + "Z",
-                            "end_time": end_time_pass.isoformat() + "Z",
+                            "start_time": start_time_pass.replace(tzinfo=timezone.utc),
+                            "end_time": end_time_pass.replace(tzinfo=timezone.utc),
                             "max_elevation": round(max_elevation, 2),
                             "duration_minutes": round(duration_seconds / 60, 1)
                         })
@@ -145,19 +433,21 @@ def calculate_satellite_passes(
 def generate_pass_schedules(db: Session, days_ahead: int = 7) -> Dict[str, Any]:
     """
     Generate pass schedules for all satellites in the database.
-    Uses pyorbital to calculate realistic orbital passes.
+    Propagates every satellite in one vectorized SGP4 batch.
     """
-    if not PYORBITAL_AVAILABLE:
-        return {"error": "pyorbital not available"}
+    if not SGP4_AVAILABLE:
+        return {"error": "sgp4/numpy not available"}
     
     try:
-        # Clear existing pass schedules
+        # Clear existing pass schedules (no session sync needed: nothing
+        # from the table is loaded in this session yet)
         logger.info("Clearing existing pass schedules...")
-        deleted_count = db.query(PassSchedule).delete()
+        deleted_count = db.query(PassSchedule).delete(synchronize_session=False)
         logger.info(f"Deleted {deleted_count} existing pass schedules")
         
-        # Get all satellites with TLE data
-        satellites = db.query(Satellite).all()
+        # Get all satellites with their TLEs eagerly loaded in one extra
+        # query, instead of a per-satellite lookup inside the loop below
+        satellites = db.query(Satellite).options(selectinload(Satellite.tles)).all()
         if not satellites:
             return {"error": "No satellites found in database"}
         
@@ -167,47 +457,44 @@ def generate_pass_schedules(db: Session, days_ahead: int = 7) -> Dict[str, Any]:
         satellites_processed = 0
         satellites_failed = 0
         
+        # Collect the latest TLE per satellite so every satellite can be
+        # propagated in a single vectorized SGP4 call
+        tle_records = []
         for satellite in satellites:
-            try:
-                # Get TLE data for this satellite
-                tle_data = get_latest_tle_for_satellite(db, str(satellite.norad_id))
-                if not tle_data:
-                    logger.warning(f"No TLE data found for satellite {satellite.norad_id}")
-                    satellites_failed += 1
-                    continue
-                
-                # Calculate passes for this satellite
-                passes = calculate_satellite_passes(
-                    norad_id=str(satellite.norad_id),
-                    tle_data=tle_data,
-                    count=3  # Generate 3 passes per satellite
-                )
-                
-                # Create pass schedules in database
-                for pass_data in passes:
-                    try:
-                        pass_schedule = PassSchedule(
-                            satellite_norad_id=satellite.norad_id,
-                            ground_station=DEFAULT_GROUND_STATION["name"],
-                            start_time=datetime.fromisoformat(pass_data["start_time"].replace('Z', '+00:00')),
-                            end_time=datetime.fromisoformat(pass_data["end_time"].replace('Z', '+00:00')),
-                            status="scheduled"
-                        )
-                        db.add(pass_schedule)
-                        schedules_created += 1
-                        
-                    except Exception as e:
-                        logger.error(f"Failed to create pass schedule for satellite {satellite.norad_id}: {e}")
-                        continue
-                
-                satellites_processed += 1
-                logger.info(f"Processed satellite {satellite.norad_id}: {len(passes)} passes generated")
-                
-            except Exception as e:
-                logger.error(f"Failed to process satellite {satellite.norad_id}: {e}")
+            if not satellite.tles:
+                logger.warning(f"No TLE data found for satellite {satellite.norad_id}")
                 satellites_failed += 1
                 continue
-        
+            latest_tle = max(satellite.tles, key=lambda t: t.timestamp)
+            tle_records.append((satellite.norad_id, latest_tle.line1, latest_tle.line2))
+
+        # Generate 3 passes per satellite; large constellations are split
+        # across CPU cores, small ones run as a single in-process batch
+        window_start = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+        passes_by_satellite = _calculate_passes_parallel(tle_records, window_start, count=3)
+
+        # Accumulate plain dicts and insert them in one bulk statement,
+        # skipping per-row ORM unit-of-work bookkeeping
+        rows = []
+        for norad_id, _line1, _line2 in tle_records:
+            passes = passes_by_satellite.get(norad_id, [])
+
+            for pass_data in passes:
+                rows.append({
+                    "satellite_norad_id": norad_id,
+                    "ground_station": DEFAULT_GROUND_STATION["name"],
+                    "start_time": pass_data["start_time"],
+                    "end_time": pass_data["end_time"],
+                    "status": "scheduled",
+                })
+
+            satellites_processed += 1
+            logger.info(f"Processed satellite {norad_id}: {len(passes)} passes generated")
+
+        if rows:
+            db.bulk_insert_mappings(PassSchedule, rows)
+        schedules_created = len(rows)
+
         # Commit all changes
         db.commit()
         logger.info(f"Committed {schedules_created} pass schedules to database")
@@ -220,7 +507,7 @@ def generate_pass_schedules(db: Session, days_ahead: int = 7) -> Dict[str, Any]:
             "satellites_processed": satellites_processed,
             "satellites_failed": satellites_failed,
             "schedules_created": schedules_created,
-            "calculation_method": "pyorbital",
+            "calculation_method": "sgp4_batch",
             "ground_station": DEFAULT_GROUND_STATION["name"],
             "status": "completed"
         }
@@ -268,7 +555,7 @@ def update_all_tle_data(db: Optional[Session] = None) -> Dict[str, Any]:
     """
     return {
         "message": "TLE data update functionality not implemented",
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
 
@@ -6,12 +6,14 @@ in satellite communication schedules, ensuring collision avoidance and
 optimal scheduling decisions.
 """
 
+import bisect
 import logging
 import os
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional, Tuple
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, text
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import and_, func, literal, or_, select, text
 from app.db.models import PassSchedule, Satellite
 
 from pathlib import Path
@@ -23,7 +25,11 @@ logger = logging.getLogger(__name__)
 env_path = Path(__file__).parent.parent.parent / ".env"
 load_dotenv(dotenv_path=env_path)
 
-DEFAULT_PASSES_PER_SATELLITE = os.getenv("DEFAULT_PASSES_PER_SATELLITE", "5")
+DEFAULT_PASSES_PER_SATELLITE = int(os.getenv("DEFAULT_PASSES_PER_SATELLITE", "5"))
+
+# Minimum separation buffer used when searching for free slots, built once
+# instead of per call
+_DEFAULT_BUFFER = timedelta(minutes=DEFAULT_PASSES_PER_SATELLITE)
 
 class ConflictType:
     """Types of schedule conflicts that can occur."""
@@ -33,26 +39,41 @@ class ConflictType:
     MINIMUM_SEPARATION_VIOLATION = "minimum_separation_violation"
 
 
+@dataclass(slots=True)
 class ScheduleConflict:
     """Represents a detected schedule conflict."""
-    
-    def __init__(self, conflict_type: str, description: str, conflicting_pass_id: int = None, 
-                 suggested_time: Optional[datetime] = None, severity: str = "high"):
-        self.conflict_type = conflict_type
-        self.description = description
-        self.conflicting_pass_id = conflicting_pass_id
-        self.suggested_time = suggested_time
-        self.severity = severity
-    
+
+    conflict_type: str
+    description: str
+    conflicting_pass_id: Optional[int] = None
+    suggested_time: Optional[datetime] = None
+    severity: str = "high"
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert conflict to dictionary for JSON serialization."""
-        return {
-            "conflict_type": self.conflict_type,
-            "description": self.description,
-            "conflicting_pass_id": self.conflicting_pass_id,
-            "suggested_time": self.suggested_time.isoformat() + "Z" if self.suggested_time else None,
-            "severity": self.severity
-        }
+        result = asdict(self)
+        result["suggested_time"] = self.suggested_time.isoformat() + "Z" if self.suggested_time else None
+        return result
+
+
+def _fast_any_overlap(db: Session, window_start: datetime, window_end: datetime) -> bool:
+    """
+    EXISTS-style probe: is anything scheduled in the buffered window?
+
+    Stops at the first matching index entry and returns a single integer,
+    so the common no-conflict case skips the detailed conflict queries
+    entirely. Any separation violation also falls inside the buffered
+    window, so a negative probe rules out both conflict types.
+    """
+    row = db.execute(
+        select(literal(1)).where(
+            and_(
+                PassSchedule.start_time < window_end,
+                PassSchedule.end_time > window_start
+            )
+        ).limit(1)
+    ).first()
+    return row is not None
 
 
 def check_temporal_conflicts(
@@ -84,42 +105,68 @@ def check_temporal_conflicts(
         buffer_timedelta = timedelta(minutes=conflict_window_minutes)
         window_start = new_pass_start - buffer_timedelta
         window_end = new_pass_end + buffer_timedelta
-        
-        # Query for overlapping passes using SQLAlchemy
+
+        # Fast path: bail out on the common case of an empty window before
+        # running the detailed per-type queries below
+        if not _fast_any_overlap(db, window_start, window_end):
+            logger.info("Checked temporal conflicts: 0 conflicts found")
+            return []
+
+        # Both checks run fully in SQL as small indexed queries (the
+        # (ground_station, start_time) composite index already exists on
+        # PassSchedule), instead of scanning every overlapping pass in Python.
+        # Fetch only the columns we read as plain row tuples - skipping full
+        # ORM entity materialization on this frequently-called path.
+
+        # Ground station conflicts: same station, overlapping the buffered window
         # Passes that overlap if: existing.start < new.end AND existing.end > new.start
-        overlapping_passes = db.query(PassSchedule).filter(
-            and_(
-                PassSchedule.start_time < window_end,
-                PassSchedule.end_time > window_start
+        gs_conflicts = db.execute(
+            select(
+                PassSchedule.pass_id,
+                PassSchedule.start_time,
+                PassSchedule.end_time,
+            ).where(
+                and_(
+                    PassSchedule.ground_station == new_ground_station,
+                    PassSchedule.start_time < window_end,
+                    PassSchedule.end_time > window_start
+                )
             )
         ).all()
-        
-        for existing_pass in overlapping_passes:
-            # Check for ground station conflicts (same ground station)
-            if existing_pass.ground_station == new_ground_station:
-                conflicts.append(ScheduleConflict(
-                    conflict_type=ConflictType.GROUND_STATION_CONFLICT,
-                    description=f"Ground station '{new_ground_station}' is already scheduled for pass {existing_pass.pass_id} "
-                              f"from {existing_pass.start_time} to {existing_pass.end_time}",
-                    conflicting_pass_id=existing_pass.pass_id,
-                    severity="high"
-                ))
-            
-            # Check for satellite access conflicts (same satellite, but this is usually OK for different ground stations)
-            if existing_pass.satellite_norad_id == new_satellite_norad_id:
-                # This is generally not a conflict unless it's the same ground station
-                pass  # Handled by ground station conflict above
-            
-            # Check for minimum separation violations
+
+        for existing_pass in gs_conflicts:
+            conflicts.append(ScheduleConflict(
+                conflict_type=ConflictType.GROUND_STATION_CONFLICT,
+                description=f"Ground station '{new_ground_station}' is already scheduled for pass {existing_pass.pass_id} "
+                          f"from {existing_pass.start_time} to {existing_pass.end_time}",
+                conflicting_pass_id=existing_pass.pass_id,
+                severity="high"
+            ))
+
+        # Minimum separation violations: any pass (on any station) starting
+        # within the buffer of the new pass's start - a range predicate on
+        # start_time so the planner can use an index seek
+        sep_conflicts = db.execute(
+            select(
+                PassSchedule.pass_id,
+                PassSchedule.start_time,
+            ).where(
+                and_(
+                    PassSchedule.start_time > new_pass_start - buffer_timedelta,
+                    PassSchedule.start_time < new_pass_start + buffer_timedelta
+                )
+            )
+        ).all()
+
+        for existing_pass in sep_conflicts:
             time_separation = abs((existing_pass.start_time - new_pass_start).total_seconds()) / 60
-            if time_separation < conflict_window_minutes:
-                conflicts.append(ScheduleConflict(
-                    conflict_type=ConflictType.MINIMUM_SEPARATION_VIOLATION,
-                    description=f"Pass {existing_pass.pass_id} is only {time_separation:.1f} minutes apart "
-                              f"from the new pass, violating minimum separation of {conflict_window_minutes} minutes",
-                    conflicting_pass_id=existing_pass.pass_id,
-                    severity="medium"
-                ))
+            conflicts.append(ScheduleConflict(
+                conflict_type=ConflictType.MINIMUM_SEPARATION_VIOLATION,
+                description=f"Pass {existing_pass.pass_id} is only {time_separation:.1f} minutes apart "
+                          f"from the new pass, violating minimum separation of {conflict_window_minutes} minutes",
+                conflicting_pass_id=existing_pass.pass_id,
+                severity="medium"
+            ))
         
         logger.info(f"Checked temporal conflicts: {len(conflicts)} conflicts found")
         return conflicts
@@ -133,6 +180,18 @@ def check_temporal_conflicts(
         )]
 
 
+def _busy_intervals(db: Session, ground_station: str) -> List[Tuple[datetime, datetime]]:
+    """
+    Get the (start_time, end_time) windows already scheduled on a ground
+    station, sorted by start time. One query replaces the repeated
+    per-candidate-slot conflict probes when searching for a free slot.
+    """
+    rows = db.query(PassSchedule.start_time, PassSchedule.end_time).filter(
+        PassSchedule.ground_station == ground_station
+    ).order_by(PassSchedule.start_time).all()
+    return [(start, end) for start, end in rows]
+
+
 def find_next_available_slot(
     requested_start: datetime,
     requested_duration_minutes: int,
@@ -140,11 +199,18 @@ def find_next_available_slot(
     satellite_norad_id: int,
     db: Session,
     search_hours_ahead: int = 168,  # 1 week
-    max_search_iterations: int = 50
+    busy_intervals: Optional[List[Tuple[datetime, datetime]]] = None
 ) -> Optional[datetime]:
     """
     Find the next available time slot that doesn't conflict with existing schedules.
-    
+
+    Fetches the ground station's scheduled windows once, merges them into
+    disjoint blocked intervals (padded so a pass of the requested duration
+    plus buffer cannot touch any window) and binary-searches for the
+    interval containing the requested start. The slot is either the
+    requested start itself or the end of that blocked interval - no
+    30-minute stepping and no per-candidate database queries.
+
     Args:
         requested_start: Desired start time
         requested_duration_minutes: Duration of the pass in minutes
@@ -152,46 +218,109 @@ def find_next_available_slot(
         satellite_norad_id: NORAD ID of the satellite
         db: Database session
         search_hours_ahead: How many hours ahead to search
-        max_search_iterations: Maximum number of time slots to check
-        
+        busy_intervals: Pre-fetched sorted (start, end) windows for the
+            ground station; fetched from the database when not provided
+
     Returns:
         Next available start time, or None if no slot found
     """
     try:
-        current_time = requested_start
-        search_end = current_time + timedelta(hours=search_hours_ahead)
-        iteration = 0
-        
-        while current_time < search_end and iteration < max_search_iterations:
-            proposed_end = current_time + timedelta(minutes=requested_duration_minutes)
-            
-            # Check for conflicts
-            conflicts = check_temporal_conflicts(
-                new_pass_start=current_time,
-                new_pass_end=proposed_end,
-                new_ground_station=ground_station,
-                new_satellite_norad_id=satellite_norad_id,
-                db=db,
-                conflict_window_minutes=DEFAULT_PASSES_PER_SATELLITE
-            )
-            
-            # If no conflicts found, this is our slot
-            if not conflicts:
-                logger.info(f"Found available slot at {current_time}")
-                return current_time
-            
-            # Move to next time slot (skip by 30 minutes)
-            current_time += timedelta(minutes=30)
-            iteration += 1
-        
+        duration = timedelta(minutes=requested_duration_minutes)
+        buffer_timedelta = _DEFAULT_BUFFER
+        search_end = requested_start + timedelta(hours=search_hours_ahead)
+
+        if busy_intervals is None:
+            busy_intervals = _busy_intervals(db, ground_station)
+
+        # A start c collides with a window (s, e) iff c is inside the open
+        # interval (s - duration - buffer, e + buffer). Build those blocked
+        # intervals (already sorted by start) and merge overlaps, so any
+        # merged-interval end is a feasible start by construction.
+        lead = duration + buffer_timedelta
+        blocked: List[Tuple[datetime, datetime]] = []
+        for busy_start, busy_end in busy_intervals:
+            blocked_start = busy_start - lead
+            blocked_end = busy_end + buffer_timedelta
+            if blocked and blocked_start < blocked[-1][1]:
+                if blocked_end > blocked[-1][1]:
+                    blocked[-1] = (blocked[-1][0], blocked_end)
+            else:
+                blocked.append((blocked_start, blocked_end))
+
+        # Locate the blocked interval containing the requested start, if any
+        candidate = requested_start
+        i = bisect.bisect_right([b[0] for b in blocked], candidate) - 1
+        if i >= 0 and blocked[i][0] < candidate < blocked[i][1]:
+            candidate = blocked[i][1]
+
+        if candidate + duration <= search_end:
+            logger.info(f"Found available slot at {candidate}")
+            return candidate
+
         logger.warning(f"No available slot found within {search_hours_ahead} hours")
         return None
-        
+
     except Exception as e:
         logger.error(f"Error finding available slot: {e}")
         return None
 
 
+def _find_conflicting_pass_ids(
+    db: Session,
+    conflict_window_minutes: int = 10
+) -> set:
+    """
+    Find every pass in conflict with another pass, in one SQL statement.
+
+    A self-join flags passes that overlap another pass on the same ground
+    station (within the separation buffer), or whose start time falls
+    within the buffer of any other pass's start. The query planner answers
+    both branches from the existing PassSchedule indexes, replacing the
+    per-pass conflict queries previously issued from Python.
+    """
+    buffer_timedelta = timedelta(minutes=conflict_window_minutes)
+    other = aliased(PassSchedule)
+
+    # SQLite has no INTERVAL type: "column + timedelta" coerces both sides
+    # to numbers and the comparison silently matches nothing, so shift the
+    # other row's datetimes with the datetime() SQL function there.
+    # PostgreSQL handles the timedelta as a native interval.
+    if db.get_bind().dialect.name == "sqlite":
+        seconds = int(buffer_timedelta.total_seconds())
+        other_end_plus_buffer = func.datetime(other.end_time, f"+{seconds} seconds")
+        other_start_minus_buffer = func.datetime(other.start_time, f"-{seconds} seconds")
+        other_start_plus_buffer = func.datetime(other.start_time, f"+{seconds} seconds")
+    else:
+        other_end_plus_buffer = other.end_time + buffer_timedelta
+        other_start_minus_buffer = other.start_time - buffer_timedelta
+        other_start_plus_buffer = other.start_time + buffer_timedelta
+
+    stmt = (
+        select(PassSchedule.pass_id)
+        .join(
+            other,
+            and_(
+                PassSchedule.pass_id != other.pass_id,
+                or_(
+                    # buffered overlap on the same ground station
+                    and_(
+                        PassSchedule.ground_station == other.ground_station,
+                        PassSchedule.start_time < other_end_plus_buffer,
+                        PassSchedule.end_time > other_start_minus_buffer,
+                    ),
+                    # minimum-separation violation on any station
+                    and_(
+                        PassSchedule.start_time > other_start_minus_buffer,
+                        PassSchedule.start_time < other_start_plus_buffer,
+                    ),
+                ),
+            ),
+        )
+        .distinct()
+    )
+    return set(db.execute(stmt).scalars().all())
+
+
 def optimize_schedule(db: Session) -> Dict[str, Any]:
     """
     Optimize the schedule by resolving conflicts and finding better time slots.
@@ -208,35 +337,50 @@ def optimize_schedule(db: Session) -> Dict[str, Any]:
         
         conflicts_resolved = 0
         rescheduled_passes = 0
-        
+
+        # Flag every conflicting pass with one self-join query instead of
+        # running a conflict query per pass
+        conflicting_ids = _find_conflicting_pass_ids(db)
+
+        # Busy windows per ground station, fetched once and kept in sync as
+        # passes are rescheduled below (instead of re-querying per candidate)
+        intervals_by_station: Dict[str, List[Tuple[datetime, datetime]]] = {}
+
         for pass_schedule in all_passes:
-            # Check for conflicts with this pass
-            conflicts = check_temporal_conflicts(
-                new_pass_start=pass_schedule.start_time,
-                new_pass_end=pass_schedule.end_time,
-                new_ground_station=pass_schedule.ground_station,
-                new_satellite_norad_id=pass_schedule.satellite_norad_id,
-                db=db
+            if pass_schedule.pass_id not in conflicting_ids:
+                continue
+
+            # Try to find a better time slot
+            duration_minutes = (pass_schedule.end_time - pass_schedule.start_time).total_seconds() / 60
+
+            station = pass_schedule.ground_station
+            if station not in intervals_by_station:
+                intervals_by_station[station] = _busy_intervals(db, station)
+            intervals = intervals_by_station[station]
+
+            # Exclude this pass's own window while searching
+            own_window = (pass_schedule.start_time, pass_schedule.end_time)
+            if own_window in intervals:
+                intervals.remove(own_window)
+
+            new_start_time = find_next_available_slot(
+                requested_start=pass_schedule.start_time,
+                requested_duration_minutes=duration_minutes,
+                ground_station=station,
+                satellite_norad_id=pass_schedule.satellite_norad_id,
+                db=db,
+                busy_intervals=intervals
             )
-            
-            if conflicts:
-                # Try to find a better time slot
-                duration_minutes = (pass_schedule.end_time - pass_schedule.start_time).total_seconds() / 60
-                
-                new_start_time = find_next_available_slot(
-                    requested_start=pass_schedule.start_time,
-                    requested_duration_minutes=duration_minutes,
-                    ground_station=pass_schedule.ground_station,
-                    satellite_norad_id=pass_schedule.satellite_norad_id,
-                    db=db
-                )
-                
-                if new_start_time and new_start_time != pass_schedule.start_time:
-                    # Update the pass schedule
-                    pass_schedule.start_time = new_start_time
-                    pass_schedule.end_time = new_start_time + timedelta(minutes=duration_minutes)
-                    rescheduled_passes += 1
-                    logger.info(f"Rescheduled pass {pass_schedule.pass_id} to {new_start_time}")
+
+            if new_start_time and new_start_time != pass_schedule.start_time:
+                # Update the pass schedule
+                pass_schedule.start_time = new_start_time
+                pass_schedule.end_time = new_start_time + timedelta(minutes=duration_minutes)
+                rescheduled_passes += 1
+                logger.info(f"Rescheduled pass {pass_schedule.pass_id} to {new_start_time}")
+
+            # Re-insert the (possibly moved) window, keeping the list sorted
+            bisect.insort(intervals, (pass_schedule.start_time, pass_schedule.end_time))
         
         # Commit changes
         db.commit()
@@ -337,30 +481,38 @@ def get_schedule_statistics(db: Session) -> Dict[str, Any]:
         Dictionary with schedule statistics
     """
     try:
-        total_passes = db.query(PassSchedule).count()
-        
-        # Count passes by status
-        status_counts = {}
-        for status in ["scheduled", "active", "completed", "cancelled"]:
-            count = db.query(PassSchedule).filter(PassSchedule.status == status).count()
-            status_counts[status] = count
-        
-        # Count passes by ground station
-        station_counts = {}
-        stations = db.query(PassSchedule.ground_station).distinct().all()
-        for station in stations:
-            count = db.query(PassSchedule).filter(PassSchedule.ground_station == station[0]).count()
-            station_counts[station[0]] = count
-        
-        # Count upcoming passes (next 24 hours)
         now = datetime.now(timezone.utc)
         tomorrow = now + timedelta(days=1)
-        upcoming_passes = db.query(PassSchedule).filter(
-            and_(
-                PassSchedule.start_time >= now,
-                PassSchedule.start_time <= tomorrow
-            )
-        ).count()
+
+        # Total and upcoming (next 24 hours) counts in one aggregate query
+        total_passes, upcoming_passes = db.execute(
+            select(
+                func.count(),
+                func.count().filter(
+                    and_(
+                        PassSchedule.start_time >= now,
+                        PassSchedule.start_time <= tomorrow
+                    )
+                ),
+            ).select_from(PassSchedule)
+        ).one()
+
+        # Count passes by status in one GROUP BY instead of one COUNT per status
+        status_counts = dict(
+            db.execute(
+                select(PassSchedule.status, func.count()).group_by(PassSchedule.status)
+            ).all()
+        )
+        for status in ["scheduled", "active", "completed", "cancelled"]:
+            status_counts.setdefault(status, 0)
+
+        # Count passes by ground station the same way (previously one
+        # DISTINCT plus one COUNT per station)
+        station_counts = dict(
+            db.execute(
+                select(PassSchedule.ground_station, func.count()).group_by(PassSchedule.ground_station)
+            ).all()
+        )
         
         return {
             "total_passes": total_passes,
@@ -1,9 +1,16 @@
 import os
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.db.models import Satellite, TLE
@@ -20,6 +27,125 @@ logger = logging.getLogger(__name__)
 # Database configuration from .env
 CELESTRAK_GP_URL: str = os.getenv("CELESTRAK_API_URL", "https://celestrak.org/NORAD/elements/gp.php")
 
+# Rows per bulk INSERT statement, keeping parameter counts well under the
+# PostgreSQL 65535 bind-parameter limit
+_IMPORT_CHUNK_SIZE = 1000
+
+# Full-catalog imports (~27k objects) switch from multi-value INSERTs to
+# COPY FROM STDIN above this row count; smaller groups aren't worth the
+# staging-table setup
+_COPY_MIN_ROWS = 5000
+
+# Shared HTTP session, created once at import: reuses the pooled TCP/TLS
+# connection across the scheduler's repeated Celestrak fetches (saving the
+# handshake round-trips per call) and retries transient upstream errors
+_http_session = requests.Session()
+_http_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
+
+# (ETag, Last-Modified) validators from the last successful fetch per
+# Celestrak group, replayed as conditional-GET headers so unchanged
+# payloads come back as a bodiless 304. In-process only: after a restart
+# the first fetch per group simply downloads unconditionally
+_group_validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+
+# Materialized view holding the newest TLE per satellite, so the "latest TLE"
+# lookup becomes a primary-key-style probe instead of an ordered index scan.
+# (A partial index on "recent" rows is not an option: Postgres rejects now()
+# in index predicates.) Refreshed after every import.
+LATEST_TLE_VIEW_DDL = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS latest_tle AS
+    SELECT DISTINCT ON (satellite_norad_id)
+           tle_id, satellite_norad_id, line1, line2, timestamp
+    FROM tle
+    ORDER BY satellite_norad_id, timestamp DESC
+"""
+
+LATEST_TLE_VIEW_INDEX_DDL = """
+CREATE UNIQUE INDEX IF NOT EXISTS idx_latest_tle_satellite
+    ON latest_tle (satellite_norad_id)
+"""
+
+# The bulk ingest path's ON CONFLICT DO NOTHING needs the unique
+# (satellite_norad_id, timestamp) index from models.py, but create_all
+# only builds indexes together with brand-new tables. Run at startup so
+# pre-existing databases get the index too; duplicates that predate the
+# constraint must be removed first or the index build fails. The DELETE
+# keeps the lowest tle_id per (satellite, epoch) pair and works on both
+# PostgreSQL and SQLite.
+TLE_DEDUP_DML = """
+DELETE FROM tle WHERE tle_id NOT IN (
+    SELECT MIN(tle_id) FROM tle GROUP BY satellite_norad_id, timestamp
+)
+"""
+
+TLE_NORAD_EPOCH_INDEX_DDL = """
+CREATE UNIQUE INDEX IF NOT EXISTS ix_tle_norad_epoch
+    ON tle (satellite_norad_id, timestamp)
+"""
+
+# The covering (satellite_norad_id, timestamp DESC) INCLUDE index from
+# models.py has the same create_all limitation: existing deployments keep
+# the old same-name non-covering index and never get the index-only
+# scans. The DO block drops the old definition - recognized by having no
+# INCLUDE payload columns (indnatts = indnkeyatts) - so the CREATE below
+# rebuilds it in covering form; on already-upgraded databases both
+# statements are no-ops. PostgreSQL only.
+TLE_COVERING_INDEX_UPGRADE_DDL = """
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1
+        FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE c.relname = 'idx_tle_satellite_timestamp'
+          AND i.indnatts = i.indnkeyatts
+    ) THEN
+        DROP INDEX idx_tle_satellite_timestamp;
+    END IF;
+END $$
+"""
+
+TLE_COVERING_INDEX_DDL = """
+CREATE INDEX IF NOT EXISTS idx_tle_satellite_timestamp
+    ON tle (satellite_norad_id, timestamp DESC)
+    INCLUDE (line1, line2, tle_id)
+"""
+
+
+def refresh_latest_tle_view(db: Session) -> None:
+    """Refresh the latest_tle materialized view after TLE writes."""
+    try:
+        db.execute(text("REFRESH MATERIALIZED VIEW latest_tle"))
+        db.commit()
+    except Exception as refresh_error:  # noqa: BLE001
+        logger.warning("Failed to refresh latest_tle view: %s", refresh_error)
+        try:
+            db.rollback()
+        except Exception as rollback_error:
+            logger.error("Database rollback failed: %s", rollback_error)
+
+
+# Fixed TLE line-1 column positions (0-based slices)
+_NORAD_SLICE = slice(2, 7)
+_EPOCH_YEAR_SLICE = slice(18, 20)
+_EPOCH_DOY_SLICE = slice(20, 32)
+
+# Unix timestamp of Jan 1 00:00 UTC per year, so the scalar epoch parser
+# can build each datetime with one fromtimestamp() call instead of
+# allocating a year-start datetime plus a timedelta per record
+_YEAR_BASE_TS: Dict[int, float] = {}
+
 
 def _parse_tle_epoch(line1: str) -> datetime:
     """
@@ -30,41 +156,46 @@ def _parse_tle_epoch(line1: str) -> datetime:
     - Columns 21-32: Epoch day of year (with fractional part)
     """
     try:
-        year_str = line1[18:20]
-        day_str = line1[20:32]
-
-        year_two_digits = int(year_str)
-        # NORAD convention: years < 57 are 2000+, else 1900+
-        year_full = 2000 + year_two_digits if year_two_digits < 57 else 1900 + year_two_digits
-
-        day_of_year = float(day_str)
-
-        start_of_year = datetime(year_full, 1, 1, tzinfo=timezone.utc)
-        epoch = start_of_year + timedelta(days=day_of_year - 1)
-        return epoch
-    except Exception:  # noqa: BLE001
+        year_two_digits = int(line1[_EPOCH_YEAR_SLICE])
+        day_of_year = float(line1[_EPOCH_DOY_SLICE])
+    except ValueError:
         logger.warning("Failed to parse TLE epoch from line1 '%s', using current UTC time", line1)
         return datetime.now(timezone.utc)
 
+    # NORAD convention: years < 57 are 2000+, else 1900+
+    year_full = 2000 + year_two_digits if year_two_digits < 57 else 1900 + year_two_digits
 
-def _validate_tle_data(line1: str, line2: str, norad_id: int) -> bool:
+    base_ts = _YEAR_BASE_TS.get(year_full)
+    if base_ts is None:
+        base_ts = _YEAR_BASE_TS.setdefault(
+            year_full, datetime(year_full, 1, 1, tzinfo=timezone.utc).timestamp()
+        )
+    return datetime.fromtimestamp(base_ts + (day_of_year - 1.0) * 86400.0, tz=timezone.utc)
+
+
+def _validate_tle_data(
+    line1: str, line2: str, norad_id: int, epoch: Optional[datetime] = None
+) -> bool:
     """
     Validate TLE data before storing in database.
     Returns True if TLE is valid, False otherwise.
+
+    An already-parsed epoch can be passed in to avoid re-parsing line 1.
     """
     try:
         # Check TLE format
         if not (line1.startswith("1 ") and line2.startswith("2 ")):
             logger.warning(f"TLE for NORAD ID {norad_id} has invalid format")
             return False
-        
+
         # Check line lengths
         if len(line1) < 69 or len(line2) < 69:
             logger.warning(f"TLE for NORAD ID {norad_id} has invalid line length")
             return False
-        
+
         # Validate epoch date
-        epoch = _parse_tle_epoch(line1)
+        if epoch is None:
+            epoch = _parse_tle_epoch(line1)
         now_utc = datetime.now(timezone.utc)
         
         # Reject future-dated TLEs
@@ -105,39 +236,93 @@ def _validate_tle_data(line1: str, line2: str, norad_id: int) -> bool:
         return False
 
 
-def _parse_tle_text(tle_text: str) -> List[Dict[str, Any]]:
+def _parse_fields_vectorized(l1s: List[str]) -> Tuple[List[int], List[datetime]]:
+    """
+    Extract NORAD IDs and epochs for a batch of TLE line 1 strings at once.
+
+    Views the lines as a fixed-width character matrix, slices the NORAD ID
+    (cols 3-7) and epoch (cols 19-32) columns for the whole batch, and does
+    the int/float/datetime conversions as array operations - replacing four
+    Python-level calls per record with a handful of NumPy calls per batch.
+    Raises ValueError if any row has a non-numeric field; the caller falls
+    back to per-record parsing.
     """
-    Parse raw TLE text into a list of records with name, NORAD ID, and TLE lines.
+    n = len(l1s)
+    flat = "".join(line[:69].ljust(69) for line in l1s)
+    chars = np.frombuffer(flat.encode("ascii", "replace"), dtype="S1").reshape(n, 69)
+
+    norad_ids = np.ascontiguousarray(chars[:, _NORAD_SLICE]).view("S5").ravel().astype(np.int64)
+    years = np.ascontiguousarray(chars[:, _EPOCH_YEAR_SLICE]).view("S2").ravel().astype(np.int64)
+    days = np.ascontiguousarray(chars[:, _EPOCH_DOY_SLICE]).view("S12").ravel().astype(np.float64)
+
+    # NORAD convention: years < 57 are 2000+, else 1900+
+    full_years = np.where(years < 57, 2000 + years, 1900 + years)
+    year_starts = (full_years - 1970).astype("datetime64[Y]").astype("datetime64[us]")
+    epochs = year_starts + ((days - 1.0) * 86400e6).astype("timedelta64[us]")
 
-    The text is expected to come in 3-line blocks:
+    epochs_py = [e.replace(tzinfo=timezone.utc) for e in epochs.tolist()]
+    return norad_ids.tolist(), epochs_py
+
+
+def _parse_tle_lines(lines) -> List[Dict[str, Any]]:
+    """
+    Parse an iterable of TLE text lines into structured records.
+
+    The input is consumed incrementally in 3-line blocks (name, line 1,
+    line 2), so it works directly off a streaming HTTP response without
+    the whole payload being buffered first:
     - Line 0: satellite name
     - Line 1: TLE line 1
     - Line 2: TLE line 2
-    """
-    lines = [ln.strip() for ln in tle_text.splitlines() if ln.strip()]
-    records: List[Dict[str, Any]] = []
 
-    for i in range(0, len(lines) - 2, 3):
-        name = lines[i]
-        line1 = lines[i + 1]
-        line2 = lines[i + 2]
-
-        # Basic validation of TLE lines
-        if not (line1.startswith("1 ") and line2.startswith("2 ")):
+    The NORAD ID and epoch fields are sliced and converted for the whole
+    batch with NumPy; a scalar per-record path handles batches containing
+    malformed numeric fields.
+    """
+    names: List[str] = []
+    l1s: List[str] = []
+    l2s: List[str] = []
+    block: List[str] = []
+    for raw_line in lines:
+        if raw_line is None:
             continue
-
-        try:
-            # Standard TLE: satellite number is columns 3-7 (index 2:7)
-            norad_id = int(line1[2:7])
-        except ValueError:
-            logger.warning("Failed to parse NORAD ID from TLE line1 '%s'", line1)
+        line = raw_line.strip()
+        if not line:
             continue
+        block.append(line)
+        if len(block) == 3:
+            # Basic validation of TLE lines
+            if block[1].startswith("1 ") and block[2].startswith("2 "):
+                names.append(block[0])
+                l1s.append(block[1])
+                l2s.append(block[2])
+            block.clear()
+
+    if not l1s:
+        return []
 
-        epoch = _parse_tle_epoch(line1)
+    try:
+        norad_ids, epochs = _parse_fields_vectorized(l1s)
+    except ValueError:
+        # Some row has a non-numeric NORAD ID or epoch field; parse each
+        # record individually so only the bad ones are dropped
+        norad_ids, epochs = [], []
+        for line1 in l1s:
+            try:
+                # Standard TLE: satellite number is columns 3-7 (index 2:7)
+                norad_ids.append(int(line1[_NORAD_SLICE]))
+            except ValueError:
+                logger.warning("Failed to parse NORAD ID from TLE line1 '%s'", line1)
+                norad_ids.append(None)
+            epochs.append(_parse_tle_epoch(line1))
 
+    records: List[Dict[str, Any]] = []
+    for name, line1, line2, norad_id, epoch in zip(names, l1s, l2s, norad_ids, epochs):
+        if norad_id is None:
+            continue
 
         # Validate TLE data before adding to records
-        if _validate_tle_data(line1, line2, norad_id):
+        if _validate_tle_data(line1, line2, norad_id, epoch=epoch):
             records.append(
                 {
                     "OBJECT_NAME": name,
@@ -153,26 +338,59 @@ def _parse_tle_text(tle_text: str) -> List[Dict[str, Any]]:
     return records
 
 
-def fetch_gp_data(group: str = "active") -> List[Dict[str, Any]]:
+def _parse_tle_text(tle_text: str) -> List[Dict[str, Any]]:
+    """Parse raw TLE text already held in memory. See _parse_tle_lines."""
+    return _parse_tle_lines(tle_text.splitlines())
+
+
+def fetch_gp_data(group: str = "active") -> Optional[List[Dict[str, Any]]]:
     """
     Fetch GP (general perturbations) orbital data from Celestrak in **TLE text** format
     and parse it into structured records.
 
+    Celestrak serves ETag/Last-Modified headers; the validators from the
+    last successful fetch are cached per group and replayed as
+    If-None-Match / If-Modified-Since, so an unchanged payload comes back
+    as a 304 and skips the download and parse entirely.
+
     :param group: Celestrak GROUP parameter, e.g. 'active', 'starlink', etc.
-    :return: List of dicts with OBJECT_NAME, NORAD_CAT_ID, TLE_LINE1, TLE_LINE2, and EPOCH.
+    :return: List of dicts with OBJECT_NAME, NORAD_CAT_ID, TLE_LINE1, TLE_LINE2, and EPOCH,
+        or None if the group is unchanged since the last fetch (HTTP 304).
     """
     params = {"GROUP": group, "FORMAT": "tle"}
+    headers = {}
+    cached_validators = _group_validators.get(group)
+    if cached_validators:
+        etag, last_modified = cached_validators
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
     try:
-        response = requests.get(CELESTRAK_GP_URL, params=params, timeout=15)
+        # Stream the response and parse line by line, instead of buffering
+        # the full multi-megabyte payload in response.text and then
+        # splitting it into a second full copy
+        response = _http_session.get(
+            CELESTRAK_GP_URL, params=params, headers=headers, stream=True, timeout=15
+        )
+        if response.status_code == 304:
+            logger.info("Celestrak group '%s' unchanged since last fetch (304)", group)
+            response.close()
+            return None
         response.raise_for_status()
+        with response:
+            records = _parse_tle_lines(response.iter_lines(decode_unicode=True))
+        _group_validators[group] = (
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        )
+        return records
     except requests.RequestException as exc:  # noqa: PERF203
         msg = f"Failed to fetch TLE data from Celestrak for group '{group}': {exc}"
         logger.error(msg)
         raise RuntimeError(msg) from exc
 
-    tle_text = response.text
-    return _parse_tle_text(tle_text)
-
 
 def upsert_satellite(db: Session, name: str, norad_id: int) -> Tuple[Satellite, bool]:
     """
@@ -189,15 +407,16 @@ def upsert_satellite(db: Session, name: str, norad_id: int) -> Tuple[Satellite,
             norad_id=norad_id,
         )
         db.add(sat)
+        # No refresh: every column came from our own input (norad_id is
+        # the natural key, not autogenerated), so re-SELECTing the row
+        # would only re-read what we just wrote
         db.commit()
-        db.refresh(sat)
         return sat, True
 
     # Optionally update name if it changed
     if sat.name != name:
         sat.name = name
         db.commit()
-        db.refresh(sat)
 
     return sat, False
 
@@ -208,20 +427,138 @@ def store_tle_for_satellite(
     line1: str,
     line2: str,
     epoch: datetime,
-) -> TLE:
+) -> int:
     """
     Create a new TLE record linked to the given satellite.
+
+    Uses a Core insert rather than an ORM instance: the record is
+    write-only here, so there is no point paying for object
+    construction, identity-map registration and the refresh SELECT.
+
+    :return: primary key of the inserted TLE row
     """
-    tle = TLE(
-        satellite_norad_id=satellite.norad_id,
-        line1=line1,
-        line2=line2,
-        timestamp=epoch,
+    result = db.execute(
+        TLE.__table__.insert().values(
+            satellite_norad_id=satellite.norad_id,
+            line1=line1,
+            line2=line2,
+            timestamp=epoch,
+        )
     )
-    db.add(tle)
     db.commit()
-    db.refresh(tle)
-    return tle
+    return result.inserted_primary_key[0]
+
+
+def _chunked(rows: List[Dict[str, Any]], size: int = _IMPORT_CHUNK_SIZE):
+    """Yield successive pages of rows for bulk statements."""
+    for i in range(0, len(rows), size):
+        yield rows[i:i + size]
+
+
+def _bulk_insert_satellites(db: Session, rows: List[Dict[str, Any]]) -> None:
+    """
+    Insert one chunk of new satellite rows, ignoring norad_id collisions.
+
+    PostgreSQL and SQLite use their native ON CONFLICT DO NOTHING (which
+    also guards against a concurrent import racing us); other dialects
+    fall back to bulk_insert_mappings, relying on the caller's pre-load
+    to have filtered out existing IDs.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        db.execute(
+            pg_insert(Satellite).values(rows).on_conflict_do_nothing(
+                index_elements=["norad_id"]
+            )
+        )
+    elif dialect == "sqlite":
+        db.execute(
+            sqlite_insert(Satellite).values(rows).on_conflict_do_nothing(
+                index_elements=["norad_id"]
+            )
+        )
+    else:
+        db.bulk_insert_mappings(Satellite, rows)
+
+
+def _bulk_insert_tles(db: Session, rows: List[Dict[str, Any]]) -> int:
+    """
+    Insert one chunk of TLE rows, skipping (satellite, epoch) duplicates.
+
+    PostgreSQL and SQLite use ON CONFLICT DO NOTHING against the unique
+    (satellite_norad_id, timestamp) index; other dialects pre-filter the
+    already-stored pairs with one SELECT and bulk-insert the rest.
+    Returns the number of rows actually written.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        insert_fn = pg_insert if dialect == "postgresql" else sqlite_insert
+        result = db.execute(
+            insert_fn(TLE).values(rows).on_conflict_do_nothing(
+                index_elements=["satellite_norad_id", "timestamp"]
+            )
+        )
+        return result.rowcount if result.rowcount >= 0 else len(rows)
+
+    existing = set(
+        db.query(TLE.satellite_norad_id, TLE.timestamp).filter(
+            TLE.satellite_norad_id.in_({r["satellite_norad_id"] for r in rows})
+        ).all()
+    )
+    fresh = [
+        r for r in rows
+        if (r["satellite_norad_id"], r["timestamp"]) not in existing
+    ]
+    if fresh:
+        db.bulk_insert_mappings(TLE, fresh)
+    return len(fresh)
+
+
+def _copy_insert_tles(db: Session, rows: List[Dict[str, Any]]) -> int:
+    """
+    Bulk-load TLE rows with PostgreSQL COPY FROM STDIN.
+
+    COPY skips the per-row statement parse/bind cost of multi-value
+    INSERTs, which dominates on full-catalog imports. The rows stream
+    into a temp staging table first, then land in tle via a single
+    INSERT ... SELECT with ON CONFLICT DO NOTHING, so the duplicate
+    handling is identical to the chunked path. The staging table is
+    dropped automatically when the surrounding transaction commits.
+    Requires the psycopg (v3) driver; returns the number of rows written.
+    """
+    db.execute(text(
+        """
+        CREATE TEMP TABLE tle_copy_staging (
+            satellite_norad_id INTEGER,
+            line1 VARCHAR(80),
+            line2 VARCHAR(80),
+            timestamp TIMESTAMPTZ
+        ) ON COMMIT DROP
+        """
+    ))
+
+    raw_conn = db.connection().connection.driver_connection
+    with raw_conn.cursor() as cursor:
+        with cursor.copy(
+            'COPY tle_copy_staging (satellite_norad_id, line1, line2, "timestamp") FROM STDIN'
+        ) as copy:
+            for row in rows:
+                copy.write_row((
+                    row["satellite_norad_id"],
+                    row["line1"],
+                    row["line2"],
+                    row["timestamp"],
+                ))
+
+    result = db.execute(text(
+        """
+        INSERT INTO tle (satellite_norad_id, line1, line2, timestamp)
+        SELECT satellite_norad_id, line1, line2, timestamp
+        FROM tle_copy_staging
+        ON CONFLICT (satellite_norad_id, timestamp) DO NOTHING
+        """
+    ))
+    return result.rowcount if result.rowcount >= 0 else len(rows)
 
 
 def import_gp_group(db: Session, group: str = "active") -> Dict[str, Any]:
@@ -230,45 +567,145 @@ def import_gp_group(db: Session, group: str = "active") -> Dict[str, Any]:
 
     - Fetches GP TLE data for the given group
     - Parses it into structured records
-    - Upserts satellites by NORAD ID
-    - Creates TLE records for each entry
+    - Upserts satellites by NORAD ID with bulk INSERT ... ON CONFLICT
+    - Bulk-inserts the TLE records in chunked multi-row statements, or
+      via COPY FROM STDIN on PostgreSQL for very large batches
+
+    One upsert and one insert per chunk of 1000 records replace the
+    previous per-record SELECT/INSERT/commit/refresh cycle, which cost
+    four round-trips and two fsyncs for every TLE in the group.
 
     :return: Summary dict with counts.
     """
     data = fetch_gp_data(group)
 
+    if data is None:
+        # Unchanged upstream payload (304): nothing to parse or write
+        return {
+            "group": group,
+            "not_modified": True,
+            "records_received": 0,
+            "satellites_created": 0,
+            "satellites_updated": 0,
+            "tles_inserted": 0,
+        }
+
     satellites_created = 0
     satellites_updated = 0
     tles_inserted = 0
 
+    # Build the row mappings up front, collapsing duplicate satellites
+    # (ON CONFLICT may not touch the same row twice within one statement).
+    # _parse_tle_lines only emits complete, validated records with integer
+    # NORAD IDs, so the fields can be read directly - no per-row
+    # completeness checks or int() re-conversion needed here
+    satellites_by_id: Dict[int, Dict[str, Any]] = {}
+    # Keyed by (norad_id, epoch) so repeats within the batch - overlapping
+    # Celestrak groups re-serve the same elements - collapse to one row
+    tle_rows_by_key: Dict[Tuple[int, datetime], Dict[str, Any]] = {}
     for item in data:
-        try:
-            name = item.get("OBJECT_NAME")
-            norad_id = int(item.get("NORAD_CAT_ID"))
-            line1 = item.get("TLE_LINE1")
-            line2 = item.get("TLE_LINE2")
-            epoch = item.get("EPOCH")
-
-            if not (name and norad_id and line1 and line2 and epoch):
-                # Skip incomplete or unparsable records
-                continue
-
-            sat, created = upsert_satellite(db, name=name, norad_id=norad_id)
-            if created:
-                satellites_created += 1
-            else:
-                satellites_updated += 1
-
-            store_tle_for_satellite(db, sat, line1=line1, line2=line2, epoch=epoch)
-            tles_inserted += 1
-
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("Skipping GP record due to error: %s", exc)
+        name = item["OBJECT_NAME"]
+        norad_id = item["NORAD_CAT_ID"]
+        line1 = item["TLE_LINE1"]
+        line2 = item["TLE_LINE2"]
+        epoch = item["EPOCH"]
+
+        satellites_by_id[norad_id] = {
+            "norad_id": norad_id,
+            "name": name,
+            "description": f"{name} (imported from Celestrak)",
+        }
+        tle_rows_by_key[(norad_id, epoch)] = {
+            "satellite_norad_id": norad_id,
+            "line1": line1,
+            "line2": line2,
+            "timestamp": epoch,
+        }
+
+    satellite_rows = list(satellites_by_id.values())
+    tle_rows = list(tle_rows_by_key.values())
+
+    try:
+        # Pre-load the satellites this batch touches in one IN (...) query
+        # and partition the rows: missing ones are inserted, existing ones
+        # are updated only if the name actually changed, the rest are not
+        # written at all (the previous ON CONFLICT upsert rewrote every row)
+        existing_names: Dict[int, str] = {}
+        if satellite_rows:
+            existing_names = dict(
+                db.query(Satellite.norad_id, Satellite.name).filter(
+                    Satellite.norad_id.in_(satellites_by_id.keys())
+                ).all()
+            )
+
+        to_insert = [
+            row for row in satellite_rows if row["norad_id"] not in existing_names
+        ]
+        to_update = [
+            {"norad_id": row["norad_id"], "name": row["name"]}
+            for row in satellite_rows
+            if row["norad_id"] in existing_names
+            and existing_names[row["norad_id"]] != row["name"]
+        ]
+
+        # Everything below runs in one outer transaction with a SAVEPOINT
+        # around each chunk, so a bad row only discards its chunk instead
+        # of forcing a rollback (or a commit+fsync) per record
+        for chunk in _chunked(to_insert):
             try:
-                db.rollback()
-            except Exception as rollback_error:
-                logger.error("Database rollback failed: %s", rollback_error)
-            continue
+                with db.begin_nested():
+                    _bulk_insert_satellites(db, chunk)
+                satellites_created += len(chunk)
+            except Exception as chunk_error:  # noqa: BLE001
+                logger.warning(
+                    "Skipping satellite chunk of %d rows: %s", len(chunk), chunk_error
+                )
+
+        if to_update:
+            db.bulk_update_mappings(Satellite, to_update)
+        satellites_updated = len(satellite_rows) - len(to_insert)
+
+        # Very large batches on PostgreSQL (with the psycopg driver) go
+        # through COPY FROM STDIN instead of chunked INSERTs; a failed
+        # COPY falls back to the chunked path rather than losing the batch
+        dialect = db.get_bind().dialect
+        copied = False
+        if (
+            len(tle_rows) >= _COPY_MIN_ROWS
+            and dialect.name == "postgresql"
+            and dialect.driver == "psycopg"
+        ):
+            try:
+                with db.begin_nested():
+                    tles_inserted = _copy_insert_tles(db, tle_rows)
+                copied = True
+            except Exception as copy_error:  # noqa: BLE001
+                logger.warning(
+                    "COPY bulk load of %d TLE rows failed, falling back to "
+                    "chunked inserts: %s", len(tle_rows), copy_error
+                )
+
+        if not copied:
+            for chunk in _chunked(tle_rows):
+                try:
+                    with db.begin_nested():
+                        # Elements already imported via another group (or a
+                        # previous run) are skipped, not duplicated
+                        chunk_inserted = _bulk_insert_tles(db, chunk)
+                    tles_inserted += chunk_inserted
+                except Exception as chunk_error:  # noqa: BLE001
+                    logger.warning(
+                        "Skipping TLE chunk of %d rows: %s", len(chunk), chunk_error
+                    )
+
+        db.commit()
+
+    except Exception as exc:  # noqa: BLE001
+        logger.error("Bulk GP import failed for group '%s': %s", group, exc)
+        try:
+            db.rollback()
+        except Exception as rollback_error:
+            logger.error("Database rollback failed: %s", rollback_error)
 
     summary = {
         "group": group,
@@ -278,6 +715,18 @@ def import_gp_group(db: Session, group: str = "active") -> Dict[str, Any]:
         "tles_inserted": tles_inserted,
     }
 
+    if tles_inserted:
+        refresh_latest_tle_view(db)
+
+    # Tell every API worker the TLE data changed so response caches are
+    # invalidated immediately rather than waiting for TTL expiry
+    if tles_inserted:
+        try:
+            db.execute(text("SELECT pg_notify('tle_updated', :payload)"), {"payload": group})
+            db.commit()
+        except Exception as notify_error:  # noqa: BLE001
+            logger.warning("Failed to send tle_updated notification: %s", notify_error)
+
     logger.info("Celestrak GP import summary: %s", summary)
     return summary
 
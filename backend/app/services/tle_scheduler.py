@@ -7,12 +7,12 @@ ensuring satellite orbital data remains current without manual intervention.
 
 import logging
 import asyncio
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional
 from pathlib import Path
 from dotenv import load_dotenv
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
+from sqlalchemy import case, func
 from sqlalchemy.orm import Session
 
 from app.services.tle_ingest import import_gp_group
@@ -26,94 +26,131 @@ load_dotenv(dotenv_path=env_path)
 logger = logging.getLogger(__name__)
 
 
+def _count_satellites_with_tle_since(db: Session, cutoff: datetime) -> int:
+    """
+    Count satellites that have at least one TLE newer than the cutoff.
+
+    Uses an EXISTS probe per satellite, which the
+    (satellite_norad_id, timestamp DESC) index answers from its first
+    entry - no DISTINCT dedup over the full join needed.
+    """
+    recent_exists = db.query(TLE).filter(
+        TLE.satellite_norad_id == Satellite.norad_id,
+        TLE.timestamp >= cutoff,
+    ).exists()
+    return db.query(func.count()).select_from(Satellite).filter(recent_exists).scalar()
+
+
+def _next_aligned_run(now: datetime, interval_hours: int, minute: int) -> datetime:
+    """
+    Next wall-clock time at the given minute of an hour divisible by
+    interval_hours (e.g. interval 6, minute 0 -> 00:00, 06:00, 12:00, 18:00).
+    """
+    candidate = now.replace(minute=minute, second=0, microsecond=0)
+    while candidate <= now or candidate.hour % interval_hours != 0:
+        candidate += timedelta(hours=1)
+    return candidate
+
+
 class TLEUpdateManager:
     """
-    Manages automated TLE updates using APScheduler for background task execution.
+    Manages automated TLE updates as plain asyncio background tasks.
+
+    The three fixed-interval jobs don't need a full scheduling engine:
+    each runs as one task that sleeps until its next hour-aligned slot,
+    which drops APScheduler's thread, per-tick scanning and import cost.
+    A single loop per job also can't overlap its own runs, so no
+    max-instances machinery is needed.
     """
-    
+
     def __init__(self):
-        self.scheduler = AsyncIOScheduler()
         self.is_running = False
         self.update_config = {
             "active_satellites": {"group": "active", "interval_hours": 6},
             "starlink": {"group": "starlink", "interval_hours": 12},
             "weather": {"group": "noaa", "interval_hours": 8}
         }
-    
+        self._job_definitions = [
+            {
+                "id": "update_active_satellites",
+                "name": "Update Active Satellites TLE Data",
+                "group": "active",
+                "interval_hours": 6,   # Every 6 hours, on the hour
+                "minute": 0,
+            },
+            {
+                "id": "update_starlink_satellites",
+                "name": "Update Starlink Satellites TLE Data",
+                "group": "starlink",
+                "interval_hours": 12,  # Every 12 hours, at :30
+                "minute": 30,
+            },
+            {
+                "id": "update_weather_satellites",
+                "name": "Update Weather Satellites TLE Data",
+                "group": "weather",
+                "interval_hours": 8,   # Every 8 hours, at :15
+                "minute": 15,
+            },
+        ]
+        self._tasks: list[asyncio.Task] = []
+        # Upcoming run time per job id, maintained by the run loops
+        self._next_runs: Dict[str, datetime] = {}
+        # (monotonic timestamp, statistics dict) from the last successful
+        # get_update_statistics call; invalidated whenever an import lands
+        self._stats_cache: Optional[tuple[float, Dict[str, Any]]] = None
+
     async def start_scheduler(self):
-        """Start the background scheduler for TLE updates."""
+        """Start the background update tasks."""
         if self.is_running:
             logger.warning("TLE update scheduler is already running")
             return
-        
+
         try:
-            # Add scheduled jobs for different satellite groups
-            await self._schedule_update_jobs()
-            
-            # Start the scheduler
-            self.scheduler.start()
+            self._tasks = [
+                asyncio.create_task(self._run_update_loop(job_def), name=job_def["id"])
+                for job_def in self._job_definitions
+            ]
             self.is_running = True
-            
+
             logger.info("TLE update scheduler started successfully")
-            
+
         except Exception as e:
-            logger.error(f"Failed to start TLE update scheduler: {e}")
+            logger.error("Failed to start TLE update scheduler: %s", e)
             raise
-    
+
     async def stop_scheduler(self):
-        """Stop the background scheduler."""
+        """Stop the background update tasks."""
         if not self.is_running:
             logger.warning("TLE update scheduler is not running")
             return
-        
+
         try:
-            self.scheduler.shutdown()
+            for task in self._tasks:
+                task.cancel()
+            self._tasks = []
+            self._next_runs = {}
             self.is_running = False
             logger.info("TLE update scheduler stopped")
-            
+
         except Exception as e:
-            logger.error(f"Failed to stop TLE update scheduler: {e}")
-    
-    async def _schedule_update_jobs(self):
-        """Schedule individual TLE update jobs for different satellite groups."""
-        
-        # Schedule active satellites update every 6 hours
-        self.scheduler.add_job(
-            func=self._update_satellite_group,
-            trigger=CronTrigger(minute=0, hour="*/6"),  # Every 6 hours
-            args=["active"],
-            id="update_active_satellites",
-            name="Update Active Satellites TLE Data",
-            max_instances=1,  # Prevent overlapping executions
-            coalesce=True,    # Combine missed executions
-            misfire_grace_time=3600  # Allow 1 hour grace period
-        )
-        
-        # Schedule Starlink satellites update every 12 hours
-        self.scheduler.add_job(
-            func=self._update_satellite_group,
-            trigger=CronTrigger(minute=30, hour="*/12"),  # Every 12 hours
-            args=["starlink"],
-            id="update_starlink_satellites",
-            name="Update Starlink Satellites TLE Data",
-            max_instances=1,
-            coalesce=True,
-            misfire_grace_time=7200  # Allow 2 hours grace period
-        )
-        
-        # Schedule weather satellites update every 8 hours
-        self.scheduler.add_job(
-            func=self._update_satellite_group,
-            trigger=CronTrigger(minute=15, hour="*/8"),  # Every 8 hours
-            args=["weather"],
-            id="update_weather_satellites",
-            name="Update Weather Satellites TLE Data",
-            max_instances=1,
-            coalesce=True,
-            misfire_grace_time=5400  # Allow 1.5 hours grace period
-        )
-        
-        logger.info(f"Scheduled {len(self.scheduler.get_jobs())} TLE update jobs")
+            logger.error("Failed to stop TLE update scheduler: %s", e)
+
+    async def _run_update_loop(self, job_def: Dict[str, Any]):
+        """Run one update job forever, sleeping until its next aligned slot."""
+        while True:
+            next_run = _next_aligned_run(
+                datetime.now(timezone.utc),
+                job_def["interval_hours"],
+                job_def["minute"],
+            )
+            self._next_runs[job_def["id"]] = next_run
+            await asyncio.sleep(
+                (next_run - datetime.now(timezone.utc)).total_seconds()
+            )
+            # _update_satellite_group handles its own errors, so one failed
+            # update never kills the loop
+            await self._update_satellite_group(job_def["group"])
     
     async def _update_satellite_group(self, group: str):
         """Background task to update TLE data for a specific satellite group."""
@@ -122,24 +159,30 @@ class TLEUpdateManager:
             # Create database session
             db = SessionLocal()
             
-            logger.info(f"Starting TLE update for satellite group: {group}")
-            
-            # Get update summary
-            summary = import_gp_group(db, group=group)
-            
-            logger.info(f"TLE update completed for group '{group}': {summary}")
-            
-            # Log update statistics
-            if summary.get("tles_inserted", 0) > 0:
-                logger.info(f"Successfully updated {summary['tles_inserted']} TLE records for {group} satellites")
+            logger.info("Starting TLE update for satellite group: %s", group)
+
+            # import_gp_group does blocking HTTP and DB work; run it in a
+            # worker thread so it doesn't stall the scheduler's event loop
+            summary = await asyncio.to_thread(import_gp_group, db, group)
             
-            if summary.get("satellites_created", 0) > 0:
-                logger.info(f"Added {summary['satellites_created']} new satellites to the database")
+            logger.info("TLE update completed for group '%s': %s", group, summary)
+
+            # Log update statistics; the dict lookups are only worth doing
+            # when INFO is actually emitted
+            if logger.isEnabledFor(logging.INFO):
+                if summary.get("tles_inserted", 0) > 0:
+                    logger.info("Successfully updated %d TLE records for %s satellites", summary['tles_inserted'], group)
+
+                if summary.get("satellites_created", 0) > 0:
+                    logger.info("Added %d new satellites to the database", summary['satellites_created'])
+
+            # The freshness statistics just changed; drop the cached copy
+            self._stats_cache = None
             
             return summary
             
         except Exception as e:
-            logger.error(f"Failed to update TLE data for group '{group}': {e}")
+            logger.error("Failed to update TLE data for group '%s': %s", group, e)
             return {"error": str(e)}
             
         finally:
@@ -158,24 +201,34 @@ class TLEUpdateManager:
         """
         if groups is None:
             groups = list(self.update_config.keys())
-        
+
         results = {}
-        
+        valid_groups = []
+
         for group in groups:
             if group not in self.update_config:
-                logger.warning(f"Unknown satellite group: {group}")
+                logger.warning("Unknown satellite group: %s", group)
                 results[group] = {"error": "Unknown satellite group"}
-                continue
-            
-            try:
-                logger.info(f"Manually triggering TLE update for group: {group}")
-                result = await self._update_satellite_group(group)
-                results[group] = result
-                
-            except Exception as e:
-                logger.error(f"Manual TLE update failed for group '{group}': {e}")
-                results[group] = {"error": str(e)}
-        
+            else:
+                valid_groups.append(group)
+
+        if valid_groups:
+            logger.info("Manually triggering TLE updates for groups: %s", valid_groups)
+
+            # Run the group updates concurrently so the three Celestrak
+            # fetches overlap; they share the pooled HTTP session but each
+            # gets its own DB session inside _update_satellite_group
+            outcomes = await asyncio.gather(
+                *(self._update_satellite_group(group) for group in valid_groups),
+                return_exceptions=True,
+            )
+            for group, outcome in zip(valid_groups, outcomes):
+                if isinstance(outcome, Exception):
+                    logger.error("Manual TLE update failed for group '%s': %s", group, outcome)
+                    results[group] = {"error": str(outcome)}
+                else:
+                    results[group] = outcome
+
         return results
     
     def get_update_status(self) -> Dict[str, Any]:
@@ -190,20 +243,21 @@ class TLEUpdateManager:
                 "scheduler_running": False,
                 "message": "TLE update scheduler is not running"
             }
-        
-        jobs = self.scheduler.get_jobs()
+
         job_status = {}
-        
-        for job in jobs:
-            job_status[job.id] = {
-                "name": job.name,
-                "next_run": job.next_run_time.isoformat() + "Z" if job.next_run_time else None,
-                "trigger": str(job.trigger)
+        for job_def in self._job_definitions:
+            next_run = self._next_runs.get(job_def["id"])
+            job_status[job_def["id"]] = {
+                "name": job_def["name"],
+                "next_run": next_run.isoformat() + "Z" if next_run else None,
+                "trigger": "every %d hours at :%02d" % (
+                    job_def["interval_hours"], job_def["minute"]
+                ),
             }
-        
+
         return {
             "scheduler_running": True,
-            "total_jobs": len(jobs),
+            "total_jobs": len(self._tasks),
             "jobs": job_status,
             "last_updated": datetime.now(timezone.utc).isoformat() + "Z"
         }
@@ -218,44 +272,53 @@ class TLEUpdateManager:
         Returns:
             Dictionary with TLE update statistics
         """
+        # The underlying aggregates scan the whole TLE table; dashboards
+        # poll this endpoint, so serve a cached copy for up to 30 seconds
+        if self._stats_cache is not None:
+            cached_at, cached_stats = self._stats_cache
+            if time.monotonic() - cached_at < 30:
+                return cached_stats
+
         try:
             # Count total satellites
             total_satellites = db.query(Satellite).count()
-            
-            # Count total TLE records
-            total_tles = db.query(TLE).count()
-            
-            # Get TLE freshness statistics
+
             now = datetime.now(timezone.utc)
-            freshness_stats = {}
-            
-            time_ranges = [
-                ("last_24h", now - timedelta(hours=24)),
-                ("last_3d", now - timedelta(days=3)),
-                ("last_7d", now - timedelta(days=7)),
-                ("older_than_7d", now - timedelta(days=7))
-            ]
-            
-            for range_name, cutoff_time in time_ranges:
-                if range_name == "older_than_7d":
-                    count = db.query(TLE).filter(TLE.timestamp < cutoff_time).count()
-                else:
-                    count = db.query(TLE).filter(TLE.timestamp >= cutoff_time).count()
-                freshness_stats[range_name] = count
-            
-            # Get satellites with recent TLE data
-            recent_tle_satellites = db.query(Satellite).join(TLE).filter(
-                TLE.timestamp >= now - timedelta(days=3)
-            ).distinct().count()
-            
-            # Calculate data freshness percentage
-            satellites_with_recent_data = db.query(Satellite).join(TLE).filter(
-                TLE.timestamp >= now - timedelta(days=7)
-            ).distinct().count()
-            
+            cutoff_24h = now - timedelta(hours=24)
+            cutoff_3d = now - timedelta(days=3)
+            cutoff_7d = now - timedelta(days=7)
+
+            # Total and all freshness buckets in one pass over TLE via
+            # conditional aggregates, instead of one COUNT query per bucket
+            (
+                total_tles,
+                last_24h,
+                last_3d,
+                last_7d,
+                older_than_7d,
+            ) = db.query(
+                func.count(),
+                func.count(case((TLE.timestamp >= cutoff_24h, 1))),
+                func.count(case((TLE.timestamp >= cutoff_3d, 1))),
+                func.count(case((TLE.timestamp >= cutoff_7d, 1))),
+                func.count(case((TLE.timestamp < cutoff_7d, 1))),
+            ).select_from(TLE).one()
+
+            freshness_stats = {
+                "last_24h": last_24h,
+                "last_3d": last_3d,
+                "last_7d": last_7d,
+                "older_than_7d": older_than_7d,
+            }
+
+            # Satellites with recent TLE data, via short-circuiting EXISTS
+            # probes on the (satellite_norad_id, timestamp DESC) index
+            recent_tle_satellites = _count_satellites_with_tle_since(db, cutoff_3d)
+            satellites_with_recent_data = _count_satellites_with_tle_since(db, cutoff_7d)
+
             freshness_percentage = (satellites_with_recent_data / total_satellites * 100) if total_satellites > 0 else 0
             
-            return {
+            stats = {
                 "total_satellites": total_satellites,
                 "total_tle_records": total_tles,
                 "satellites_with_recent_data_3d": recent_tle_satellites,
@@ -263,9 +326,11 @@ class TLEUpdateManager:
                 "tle_freshness_stats": freshness_stats,
                 "last_updated": now.isoformat() + "Z"
             }
+            self._stats_cache = (time.monotonic(), stats)
+            return stats
             
         except Exception as e:
-            logger.error(f"Failed to get update statistics: {e}")
+            logger.error("Failed to get update statistics: %s", e)
             return {"error": f"Failed to get statistics: {e}"}
 
 
@@ -15,4 +15,16 @@ pip install -r requirements.txt
 
 # Run the FastAPI application
 # The --host 0.0.0.0 ensures it's accessible from the frontend
-uvicorn app.main:app --reload --host 0.0.0.0 --port 8000
+# --loop uvloop and --http httptools use the C event loop / HTTP parser
+# (~2x faster socket I/O than the asyncio/h11 defaults). In production mode
+# multiple worker processes are started (one per CPU by default, override
+# with WORKERS=n) since a single process is capped by the GIL.
+# Set RELOAD=1 for single-process development mode with auto-reload.
+if [ "${RELOAD:-0}" = "1" ]; then
+    uvicorn app.main:app --reload --host 0.0.0.0 --port 8000 \
+        --loop uvloop --http httptools
+else
+    uvicorn app.main:app --host 0.0.0.0 --port 8000 \
+        --loop uvloop --http httptools \
+        --workers "${WORKERS:-$(nproc)}" --no-access-log
+fi
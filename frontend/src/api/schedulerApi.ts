@@ -20,6 +20,11 @@ export type PassSchedule = {
   status: string;
 };
 
+export type PassSchedulePage = {
+  items: PassSchedule[];
+  next_cursor: string | null;
+};
+
 export type Satellite = {
   norad_id: number;
   name: string;
@@ -81,18 +86,29 @@ export const fetchSatellites = async (): Promise<Satellite[]> =>
     priority: "critical", // Critical for initial dashboard load
   });
 
-export const fetchPassSchedules = async (): Promise<PassSchedule[]> =>
-  request("/pass-schedules", {
-    priority: "critical", // Critical for initial dashboard load
-  });
+export const fetchPassSchedules = async (
+  cursor?: string | null,
+  limit = 500
+): Promise<PassSchedulePage> =>
+  request(
+    `/pass-schedules?limit=${limit}${
+      cursor ? `&cursor_start_time=${encodeURIComponent(cursor)}` : ""
+    }`,
+    {
+      priority: "critical", // Critical for initial dashboard load
+    }
+  );
 
-export const refreshTle = async (
-  group = "active"
-): Promise<{
+// Long-running POSTs are accepted with 202; poll the returned job URL
+// (GET /jobs/{job_id}) for the result
+export type JobAccepted = {
   status: string;
   message: string;
-  summary: unknown;
-}> =>
+  job_id: string;
+  poll: string;
+};
+
+export const refreshTle = async (group = "active"): Promise<JobAccepted> =>
   request(`/tle/refresh?group=${encodeURIComponent(group)}`, {
     method: "POST",
     priority: "low", // Background operation
@@ -101,11 +117,7 @@ export const refreshTle = async (
 export const generatePassSchedules = async (
   method = "sample",
   days_ahead = 7
-): Promise<{
-  status: string;
-  message: string;
-  summary: unknown;
-}> =>
+): Promise<JobAccepted> =>
   request(
     `/pass-schedules/generate?method=${encodeURIComponent(
       method
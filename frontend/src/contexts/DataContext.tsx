@@ -1,6 +1,7 @@
 import React, { useReducer, useCallback, useEffect, useMemo } from "react";
 import type { ReactNode } from "react";
 import { fetchSatellites, fetchPassSchedules } from "../api/schedulerApi";
+import type { PassSchedule } from "../api/schedulerApi";
 import { dataReducer } from "../reducer/DataReducer";
 import { initialState } from "../constants/dataConstants";
 import { DataContext } from "./DataContextType";
@@ -27,8 +28,16 @@ export const DataProvider: React.FC<{ children: ReactNode }> = ({
   const fetchPassSchedulesData = useCallback(async () => {
     dispatch({ type: "FETCH_PASS_SCHEDULES_START" });
     try {
-      const data = await fetchPassSchedules();
-      dispatch({ type: "FETCH_PASS_SCHEDULES_SUCCESS", payload: data });
+      // The endpoint is keyset-paginated; follow next_cursor until the
+      // full schedule list has been collected
+      const items: PassSchedule[] = [];
+      let cursor: string | null = null;
+      do {
+        const page = await fetchPassSchedules(cursor);
+        items.push(...page.items);
+        cursor = page.next_cursor;
+      } while (cursor);
+      dispatch({ type: "FETCH_PASS_SCHEDULES_SUCCESS", payload: items });
     } catch (error) {
       const errorMessage =
         error instanceof Error
@@ -117,7 +117,7 @@ run_backend() {
     pip install -q -r requirements.txt
     
     # Run Uvicorn and pipe to transformer
-    exec uvicorn app.main:app --host 0.0.0.0 --port $INT_BE_PORT --reload 2>&1 | format_log "BE" "$CLR_BE" "API"
+    exec uvicorn app.main:app --host 0.0.0.0 --port $INT_BE_PORT --reload --loop uvloop --http httptools 2>&1 | format_log "BE" "$CLR_BE" "API"
 }
 run_backend &
 BE_PID=$!